@@ -13,7 +13,7 @@ The data source of an individual object is specified as an URI in its ``source``
 defines the type of data source and, in consequence, the backend class to use for synchronizing this object.
 
 Custom backends for additional types of data sources can be implemented by subclassing :class:`Backend` and
-implementing the :meth:`~.Backend.commit_object` and :meth:`~.Backend.update_object` class methods. These are used
+implementing the :meth:`~.Backend.commit_object` and :meth:`~.Backend.update_object` static methods. These are used
 internally by the objects' :meth:`~basyx.aas.model.base.Referable.update` and
 :meth:`~basyx.aas.model.base.Referable.commit` methods when the backend is applicable for the relevant source URI.
 Then, the Backend class needs to be registered to handle update/commit requests for a specific URI schema, using
@@ -21,7 +21,10 @@ Then, the Backend class needs to be registered to handle update/commit requests
 """
 import abc
 import re
-from typing import List, Dict, Type, TYPE_CHECKING
+import sys
+import threading
+from types import MappingProxyType
+from typing import List, Dict, Iterable, Mapping, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..model import Referable
@@ -36,16 +39,19 @@ class Backend(metaclass=abc.ABCMeta):
     from this class and be registered via :meth:`~basyx.aas.backend.backends.register_backend`. to be used by Referable
     object's :meth:`~basyx.aas.model.base.Referable.update` and :meth:`~basyx.aas.model.base.Referable.commit` methods
     when required.
+
+    Backend classes are typically not instantiated. Thus, this class does not provide a ``__dict__`` for instances.
+    Custom backends which require instance attributes should declare them via ``__slots__`` as well.
     """
+    __slots__ = ()
 
-    @classmethod
+    @staticmethod
     @abc.abstractmethod
-    def commit_object(cls,
-                      committed_object: "Referable",
+    def commit_object(committed_object: "Referable",
                       store_object: "Referable",
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
         """
-        Function (class method) to be called when an object shall be committed (local changes pushed to the external
+        Function (static method) to be called when an object shall be committed (local changes pushed to the external
         data source) via this backend implementation.
 
         It is automatically called by the :meth:`~basyx.aas.model.base.Referable.commit` implementation, when the source
@@ -68,23 +74,22 @@ class Backend(metaclass=abc.ABCMeta):
         :param committed_object: The object which shall be synced to the external data source
         :param store_object: The object which originates from the relevant data source (i.e. has the relevant source
             attribute). It may be the ``committed_object`` or one of its ancestors in the AAS object hierarchy.
-        :param relative_path: List of idShort strings to resolve the ``committed_object`` starting at the
+        :param relative_path: Tuple of idShort strings to resolve the ``committed_object`` starting at the
             ``store_object``, such that `obj = store_object; for i in relative_path: obj = obj.get_referable(i)`
             resolves to the ``committed_object``. In case that ``store_object is committed_object``, it is an empty
-            list.
+            tuple.
         :raises BackendNotAvailableException: when the external data source cannot be reached
         """
         pass
 
-    @classmethod
+    @staticmethod
     @abc.abstractmethod
-    def update_object(cls,
-                      updated_object: "Referable",
+    def update_object(updated_object: "Referable",
                       store_object: "Referable",
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
         """
-        Function (class method) to be called when an object shall be updated (local object updated with changes from the
-        external data source) via this backend implementation.
+        Function (static method) to be called when an object shall be updated (local object updated with changes from
+        the external data source) via this backend implementation.
 
         It is automatically called by the :meth:`~basyx.aas.model.base.Referable.update` implementation,
         when the source URI of the object or the source URI one of its ancestors in the AAS object containment hierarchy
@@ -106,17 +111,27 @@ class Backend(metaclass=abc.ABCMeta):
         :param updated_object: The object which shall be synced from the external data source
         :param store_object: The object which originates from the relevant data source (i.e. has the relevant source
             attribute). It may be the ``committed_object`` or one of its ancestors in the AAS object hierarchy.
-        :param relative_path: List of idShort strings to resolve the ``updated_object`` starting at the
+        :param relative_path: Tuple of idShort strings to resolve the ``updated_object`` starting at the
             ``store_object``, such that `obj = store_object; for i in relative_path: obj = obj.get_referable(i)`
-            resolves to the ``updated_object``. In case that ``store_object is updated_object``, it is an empty list.
+            resolves to the ``updated_object``. In case that ``store_object is updated_object``, it is an empty tuple.
         :raises BackendNotAvailableException: when the external data source cannot be reached
         """
         pass
 
 
+# URI scheme grammar as specified in RFC 3986, section 3.1: ``ALPHA *( ALPHA / DIGIT / "+" / "-" / "." )``. Do not widen
+# this beyond the RFC; non-ASCII letters and digits are explicitly excluded.
+RE_URI_SCHEME = re.compile(r"([A-Za-z][A-Za-z0-9+\-.]*):", re.ASCII)
+
 # Global registry for backends by URI scheme
+# The registry is copy-on-write: register_backend() publishes a new read-only snapshot, such that readers never need to
+# acquire a lock and never observe a dict during modification. Each snapshot comes with its own cache of get_backend()
+# results by full url. A reader, which resolved a url with an outdated snapshot, thus only fills the outdated cache.
 # TODO allow multiple backends per scheme with priority
-_backends_map: Dict[str, Type[Backend]] = {}
+_backends_snapshot: Tuple[Mapping[str, Type[Backend]], Dict[str, Type[Backend]]] = (MappingProxyType({}), {})
+_backends_map_write_lock = threading.Lock()
+# Maximum number of urls cached per snapshot of the registry
+_GET_BACKEND_CACHE_SIZE = 1024
 
 
 def register_backend(scheme: str, backend_class: Type[Backend]) -> None:
@@ -130,12 +145,33 @@ def register_backend(scheme: str, backend_class: Type[Backend]) -> None:
     :param scheme: The URI schema of source URIs to be handled with Backend class, without trailing colon and slashes.
         E.g. 'http', 'https', 'couchdb', etc.
     :param backend_class: The Backend implementation class. Should inherit from :class:`Backend`.
+    :raises ValueError: If ``scheme`` is not a valid URI scheme
     """
+    # The scheme is validated here, such that get_backend() only needs to validate the scheme of urls, which don't
+    # match any registered backend.
+    if not RE_URI_SCHEME.fullmatch(scheme + ":"):
+        raise ValueError(f"{scheme!r} is not a valid URI scheme.")
+    global _backends_snapshot
     # TODO handle multiple backends per scheme
-    _backends_map[scheme] = backend_class
+    with _backends_map_write_lock:
+        backends_map = MappingProxyType({**_backends_snapshot[0], sys.intern(scheme): backend_class})
+        # The mapping and its (empty) cache are published at once
+        _backends_snapshot = (backends_map, {})
 
 
-RE_URI_SCHEME = re.compile(r"^([a-zA-Z][a-zA-Z+\-\.]*):")
+def _get_uri_scheme(url: str) -> str:
+    """
+    Internal function to extract the URI scheme from the given ``url``.
+
+    :param url: External data source URI
+    :return: The URI scheme of the url, without trailing colon
+    :raises ValueError: If the url does not contain an URI scheme
+    """
+    i = url.find(':')
+    if i <= 0:
+        raise ValueError(f"{url!r} is not a valid URL with URI scheme.")
+    # Interned, such that the lookup in the backends map (with interned keys) succeeds with an identity check
+    return sys.intern(url[:i])
 
 
 def get_backend(url: str) -> Type[Backend]:
@@ -143,19 +179,60 @@ def get_backend(url: str) -> Type[Backend]:
     Internal function to retrieve the Backend implementation for the external data source identified by the given
     ``url`` via the url's schema.
 
+    The results are cached by the full ``url``: The same source URIs are resolved again and again when synchronizing
+    objects and the hash of these strings is already cached by Python, so a cache hit does not require to slice and
+    hash the scheme. The cache belongs to the current snapshot of the registry and is replaced by
+    :func:`register_backend`.
+
     :param url: External data source URI to find an appropriate Backend implementation for
     :return: A Backend class, capable of updating/committing from/to the external data source
+    :raises ValueError: If the url does not start with a syntactically valid URI scheme
     :raises UnknownBackendException: When no backend is available for that url
     """
     # TODO handle multiple backends per scheme
-    scheme_match = RE_URI_SCHEME.match(url)
-    if not scheme_match:
-        raise ValueError("{} is not a valid URL with URI scheme.".format(url))
-    scheme = scheme_match[1]
+    # Read the snapshot only once, such that the result is always cached in the cache of the mapping it stems from
+    backends_map, cache = _backends_snapshot
+    try:
+        return cache[url]
+    except KeyError:
+        pass
+    scheme = _get_uri_scheme(url)
     try:
-        return _backends_map[scheme]
+        backend = backends_map[scheme]
     except KeyError as e:
-        raise UnknownBackendException("Could not find Backend for source '{}'".format(url)) from e
+        # Registered schemes are valid, so only urls missing the registry need to be checked for a valid scheme
+        if not RE_URI_SCHEME.fullmatch(scheme + ":"):
+            raise ValueError(f"{url!r} is not a valid URL with URI scheme.") from None
+        raise UnknownBackendException(f"Could not find Backend for source {url!r}") from e
+    if len(cache) < _GET_BACKEND_CACHE_SIZE:
+        cache[url] = backend
+    return backend
+
+
+def get_backends(urls: Iterable[str]) -> List[Type[Backend]]:
+    """
+    Internal function to retrieve the Backend implementations for multiple external data sources at once.
+
+    This is equivalent to calling :func:`get_backend` for each of the ``urls``, but each distinct URI scheme is only
+    resolved once, which is considerably faster when synchronizing many objects from only a few types of data sources.
+
+    :param urls: External data source URIs to find appropriate Backend implementations for
+    :return: A list of Backend classes, one for each of the given ``urls`` in the same order
+    :raises ValueError: If one of the urls does not start with a syntactically valid URI scheme
+    :raises UnknownBackendException: When no backend is available for one of the urls
+    """
+    result: List[Type[Backend]] = []
+    backends_by_scheme: Dict[str, Type[Backend]] = {}
+    for url in urls:
+        # Includes the colon, so urls without any colon are passed on to get_backend() for error reporting
+        scheme = url[:url.find(':') + 1]
+        try:
+            result.append(backends_by_scheme[scheme])
+        except KeyError:
+            backend = get_backend(url)
+            backends_by_scheme[scheme] = backend
+            result.append(backend)
+    return result
 
 
 # #################################################################################################
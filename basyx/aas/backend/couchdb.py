@@ -13,7 +13,7 @@ The :class:`~.CouchDBBackend` takes care of updating and committing objects from
 """
 import threading
 import weakref
-from typing import List, Dict, Any, Optional, Iterator, Iterable, Union, Tuple
+from typing import Dict, Any, Optional, Iterator, Iterable, Union, Tuple
 import urllib.parse
 import urllib.request
 import urllib.error
@@ -37,11 +37,10 @@ class CouchDBBackend(backends.Backend):
     containing the JSON serialization of the BaSyx Python SDK object. The :ref:`adapter.json <adapter.json.__init__>`
     package is used for serialization and deserialization of objects.
     """
-    @classmethod
-    def update_object(cls,
-                      updated_object: model.Referable,
+    @staticmethod
+    def update_object(updated_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
 
         if not isinstance(store_object, model.Identifiable):
             raise CouchDBSourceError("The given store_object is not Identifiable, therefore cannot be found "
@@ -59,11 +58,10 @@ class CouchDBBackend(backends.Backend):
         set_couchdb_revision(url, data["_rev"])
         store_object.update_from(updated_store_object)
 
-    @classmethod
-    def commit_object(cls,
-                      committed_object: model.Referable,
+    @staticmethod
+    def commit_object(committed_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
         if not isinstance(store_object, model.Identifiable):
             raise CouchDBSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                      "in the CouchDB")
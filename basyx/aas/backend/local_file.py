@@ -11,7 +11,7 @@ in local files.
 The :class:`~.LocalFileBackend` takes care of updating and committing objects from and to the files, while the
 :class:`~LocalFileObjectStore` handles adding, deleting and otherwise managing the AAS objects in a specific Directory.
 """
-from typing import List, Iterator, Iterable, Union
+from typing import Iterator, Iterable, Tuple, Union
 import logging
 import json
 import os
@@ -35,11 +35,10 @@ class LocalFileBackend(backends.Backend):
     :ref:`adapter.json <adapter.json.__init__>` package is used for serialization and deserialization of objects.
     """
 
-    @classmethod
-    def update_object(cls,
-                      updated_object: model.Referable,
+    @staticmethod
+    def update_object(updated_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
 
         if not isinstance(store_object, model.Identifiable):
             raise FileBackendSourceError("The given store_object is not Identifiable, therefore cannot be found "
@@ -50,11 +49,10 @@ class LocalFileBackend(backends.Backend):
             updated_store_object = data["data"]
             store_object.update_from(updated_store_object)
 
-    @classmethod
-    def commit_object(cls,
-                      committed_object: model.Referable,
+    @staticmethod
+    def commit_object(committed_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: Tuple[str, ...]) -> None:
         if not isinstance(store_object, model.Identifiable):
             raise FileBackendSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                          "in the FileBackend")
@@ -27,6 +27,7 @@ The following types aliased in the :mod:`~basyx.aas.model.base` module are const
 - :class:`~basyx.aas.model.base.ValueTypeIEC61360`
 """
 
+import operator
 import re
 
 from typing import Callable, Optional, Type, TypeVar
@@ -127,19 +128,20 @@ def create_check_function(min_length: int = 0, max_length: Optional[int] = None,
 # Decorator functions to add getter/setter to classes for verification, whenever a value is updated.
 def constrain_attr(pub_attr_name: str, constraint_check_fn: Callable[[str], None]) \
         -> Callable[[Type[_T]], Type[_T]]:
-    def decorator_fn(decorated_class: Type[_T]) -> Type[_T]:
-        def _getter(self) -> Optional[str]:
-            return getattr(self, "_" + pub_attr_name)
+    priv_attr_name = "_" + pub_attr_name
 
+    def decorator_fn(decorated_class: Type[_T]) -> Type[_T]:
         def _setter(self, value: Optional[str]) -> None:
             # if value is None, skip checks. incorrect 'None' assignments are caught by the type checker anyway
             if value is not None:
                 constraint_check_fn(value)
-            setattr(self, "_" + pub_attr_name, value)
+            setattr(self, priv_attr_name, value)
 
         if hasattr(decorated_class, pub_attr_name):
             raise AttributeError(f"{decorated_class.__name__} already has an attribute named '{pub_attr_name}'")
-        setattr(decorated_class, pub_attr_name, property(_getter, _setter))
+        # attrgetter() is implemented in C, which makes reading the attribute cheaper than a Python-level getter. An
+        # explicit (empty) doc is required, as property() would use the docstring of attrgetter otherwise.
+        setattr(decorated_class, pub_attr_name, property(operator.attrgetter(priv_attr_name), _setter, doc=""))
         return decorated_class
 
     return decorator_fn
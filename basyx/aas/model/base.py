@@ -10,12 +10,13 @@ the higher level classes to inherit from.
 """
 
 import abc
-import inspect
 import itertools
+import operator
 from enum import Enum, unique
 from typing import List, Optional, Set, TypeVar, MutableSet, Generic, Iterable, Dict, Iterator, Union, overload, \
-    MutableSequence, Type, Any, TYPE_CHECKING, Tuple, Callable, MutableMapping
+    MutableSequence, Type, Any, TYPE_CHECKING, Tuple, Callable, MutableMapping, FrozenSet
 import re
+import time
 
 from . import datatypes, _string_constraints
 from ..backend import backends
@@ -42,6 +43,9 @@ ShortNameType = str
 VersionType = str
 ValueTypeIEC61360 = str
 
+# Constraint AASd-002: idShort shall only feature letters, digits, underscore; starting mandatory with a letter
+_ID_SHORT_RE = re.compile("[a-zA-Z][a-zA-Z0-9_]*")
+
 
 @unique
 class KeyTypes(Enum):
@@ -128,51 +132,64 @@ class KeyTypes(Enum):
     GLOBAL_REFERENCE = 2000
     FRAGMENT_REFERENCE = 2001
 
+    # The classification properties below are evaluated for every Key of every Reference that is constructed. Thus,
+    # they use the member tuples precomputed at module level (see below) instead of building them on every call. Since
+    # Enum members are singletons and Enum does not override __eq__, the `in` checks boil down to identity checks.
     @property
     def is_aas_identifiable(self) -> bool:
-        return self in (self.ASSET_ADMINISTRATION_SHELL, self.CONCEPT_DESCRIPTION, self.SUBMODEL)
+        return self in _AAS_IDENTIFIABLE_KEY_TYPES
 
     @property
     def is_generic_globally_identifiable(self) -> bool:
-        return self == self.GLOBAL_REFERENCE
+        return self is KeyTypes.GLOBAL_REFERENCE
 
     @property
     def is_generic_fragment_key(self) -> bool:
-        return self == self.FRAGMENT_REFERENCE
+        return self is KeyTypes.FRAGMENT_REFERENCE
 
     @property
     def is_aas_submodel_element(self) -> bool:
-        return self in (
-            self.ANNOTATED_RELATIONSHIP_ELEMENT,
-            self.BASIC_EVENT_ELEMENT,
-            self.BLOB,
-            self.CAPABILITY,
-            self.DATA_ELEMENT,
-            self.ENTITY,
-            self.EVENT_ELEMENT,
-            self.FILE,
-            self.MULTI_LANGUAGE_PROPERTY,
-            self.OPERATION,
-            self.PROPERTY,
-            self.RANGE,
-            self.REFERENCE_ELEMENT,
-            self.RELATIONSHIP_ELEMENT,
-            self.SUBMODEL_ELEMENT,
-            self.SUBMODEL_ELEMENT_COLLECTION,
-            self.SUBMODEL_ELEMENT_LIST
-        )
+        return self in _AAS_SUBMODEL_ELEMENT_KEY_TYPES
 
     @property
     def is_aas_referable_non_identifiable(self) -> bool:
-        return self.is_aas_submodel_element
+        return self in _AAS_SUBMODEL_ELEMENT_KEY_TYPES
 
     @property
     def is_fragment_key_element(self) -> bool:
-        return self.is_aas_referable_non_identifiable or self.is_generic_fragment_key
+        return self in _FRAGMENT_KEY_TYPES
 
     @property
     def is_globally_identifiable(self) -> bool:
-        return self.is_aas_identifiable or self.is_generic_globally_identifiable
+        return self in _GLOBALLY_IDENTIFIABLE_KEY_TYPES
+
+
+_AAS_IDENTIFIABLE_KEY_TYPES: Tuple[KeyTypes, ...] = (
+    KeyTypes.ASSET_ADMINISTRATION_SHELL,
+    KeyTypes.CONCEPT_DESCRIPTION,
+    KeyTypes.SUBMODEL,
+)
+_AAS_SUBMODEL_ELEMENT_KEY_TYPES: Tuple[KeyTypes, ...] = (
+    KeyTypes.ANNOTATED_RELATIONSHIP_ELEMENT,
+    KeyTypes.BASIC_EVENT_ELEMENT,
+    KeyTypes.BLOB,
+    KeyTypes.CAPABILITY,
+    KeyTypes.DATA_ELEMENT,
+    KeyTypes.ENTITY,
+    KeyTypes.EVENT_ELEMENT,
+    KeyTypes.FILE,
+    KeyTypes.MULTI_LANGUAGE_PROPERTY,
+    KeyTypes.OPERATION,
+    KeyTypes.PROPERTY,
+    KeyTypes.RANGE,
+    KeyTypes.REFERENCE_ELEMENT,
+    KeyTypes.RELATIONSHIP_ELEMENT,
+    KeyTypes.SUBMODEL_ELEMENT,
+    KeyTypes.SUBMODEL_ELEMENT_COLLECTION,
+    KeyTypes.SUBMODEL_ELEMENT_LIST,
+)
+_FRAGMENT_KEY_TYPES: Tuple[KeyTypes, ...] = _AAS_SUBMODEL_ELEMENT_KEY_TYPES + (KeyTypes.FRAGMENT_REFERENCE,)
+_GLOBALLY_IDENTIFIABLE_KEY_TYPES: Tuple[KeyTypes, ...] = _AAS_IDENTIFIABLE_KEY_TYPES + (KeyTypes.GLOBAL_REFERENCE,)
 
 
 @unique
@@ -402,6 +419,8 @@ class Key:
                of another AAS. The name of the model element is explicitly listed.
     :ivar value: The key value, for example an IRDI or IRI
     """
+    # Keys are by far the most frequently instantiated objects of the metamodel. Use slots to avoid a per-instance dict.
+    __slots__ = ('type', 'value', '_hash')
 
     def __init__(self,
                  type_: KeyTypes,
@@ -412,13 +431,21 @@ class Key:
         _string_constraints.check_identifier(value)
         self.type: KeyTypes
         self.value: Identifier
+        self._hash: int
         super().__setattr__('type', type_)
         super().__setattr__('value', value)
+        # Keys are immutable, so we can calculate the hash once, instead of on every lookup in a set or dict
+        super().__setattr__('_hash', hash((value, type_)))
 
     def __setattr__(self, key, value):
         """Prevent modification of attributes."""
         raise AttributeError('Reference is immutable')
 
+    def __reduce__(self):
+        # copy and pickle would restore the slots via setattr(), which is prevented above. So rebuild the Key via the
+        # constructor, which also recalculates the hash.
+        return self.__class__, (self.type, self.value)
+
     def __repr__(self) -> str:
         return "Key(type={}, value={})".format(self.type.name, self.value)
 
@@ -428,11 +455,12 @@ class Key:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Key):
             return NotImplemented
-        return (self.value == other.value
-                and self.type == other.type)
+        # Compare the key types first: the identity check of the enum members is cheaper than comparing the values
+        return (self.type is other.type
+                and self.value == other.value)
 
     def __hash__(self):
-        return hash((self.value, self.type))
+        return self._hash
 
     def get_identifier(self) -> Optional[Identifier]:
         """
@@ -452,19 +480,24 @@ class Key:
         :param referable: :class:`~.Referable` or :class:`~.Identifiable` object
         :returns: :class:`~.Key`
         """
-        # Get the `type` by finding the first class from the base classes list (via inspect.getmro), that is contained
-        # in KEY_ELEMENTS_CLASSES
-        from . import KEY_TYPES_CLASSES, SubmodelElementList
-        try:
-            key_type = next(iter(KEY_TYPES_CLASSES[t]
-                                 for t in inspect.getmro(type(referable))
-                                 if t in KEY_TYPES_CLASSES))
-        except StopIteration:
+        # Get the `type` by finding the first class from the base classes list (via __mro__), that is contained
+        # in KEY_TYPES_CLASSES. The result only depends on the class of the referable, so it is cached per class.
+        referable_type = type(referable)
+        key_type = _KEY_TYPE_BY_CLASS.get(referable_type)
+        if key_type is None:
+            from . import KEY_TYPES_CLASSES
             key_type = KeyTypes.PROPERTY
+            for t in referable_type.__mro__:
+                class_key_type = KEY_TYPES_CLASSES.get(t)
+                if class_key_type is not None:
+                    key_type = class_key_type
+                    break
+            _KEY_TYPE_BY_CLASS[referable_type] = key_type
 
-        if isinstance(referable, Identifiable):
-            return Key(key_type, referable.id)
-        elif isinstance(referable.parent, SubmodelElementList):
+        if referable._is_identifiable:
+            return Key(key_type, referable.id)  # type: ignore
+        from .submodel import SubmodelElementList
+        if isinstance(referable.parent, SubmodelElementList):
             try:
                 return Key(key_type, str(referable.parent.value.index(referable)))  # type: ignore
             except ValueError as e:
@@ -475,6 +508,11 @@ class Key:
             return Key(key_type, referable.id_short)
 
 
+# Cache for Key.from_referable(), mapping each concrete Referable class to the KeyTypes member of its first base class
+# found in KEY_TYPES_CLASSES.
+_KEY_TYPE_BY_CLASS: Dict[type, KeyTypes] = {}
+
+
 _NSO = TypeVar('_NSO', bound=Union["Referable", "Qualifier", "HasSemantics", "Extension"])
 
 
@@ -498,11 +536,14 @@ class Namespace(metaclass=abc.ABCMeta):
 
         :raises KeyError: If no such :class:`~._NSO` can be found
         """
+        # Only query the sets indexing the attribute and use NamespaceSet.get() instead of catching a KeyError for each
+        # set not containing the object
         for ns_set in self.namespace_element_sets:
-            try:
-                return ns_set.get_object_by_attribute(attribute_name, attribute)
-            except KeyError:
+            if attribute_name not in ns_set._backend:
                 continue
+            obj = ns_set.get(attribute_name, attribute)
+            if obj is not None:
+                return obj
         raise KeyError(f"{object_type.__name__} with {attribute_name} {attribute} not found in this namespace")
 
     def _add_object(self, attribute_name: str, obj: _NSO) -> None:
@@ -512,7 +553,7 @@ class Namespace(metaclass=abc.ABCMeta):
         :raises KeyError: If no such :class:`~._NSO` can be found
         """
         for ns_set in self.namespace_element_sets:
-            if attribute_name not in ns_set.get_attribute_name_list():
+            if attribute_name not in ns_set._backend:
                 continue
             ns_set.add(obj)
             return
@@ -525,12 +566,12 @@ class Namespace(metaclass=abc.ABCMeta):
         :raises KeyError: If no such :class:`~.NSO` can be found
         """
         for ns_set in self.namespace_element_sets:
-            if attribute_name in ns_set.get_attribute_name_list():
-                try:
-                    ns_set.remove_by_id(attribute_name, attribute)
-                    return
-                except KeyError:
-                    continue
+            if attribute_name not in ns_set._backend:
+                continue
+            obj = ns_set.get(attribute_name, attribute)
+            if obj is not None:
+                ns_set.remove(obj)
+                return
         raise KeyError(f"{object_type.__name__} with {attribute_name} {attribute} not found in this namespace")
 
 
@@ -607,17 +648,23 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                   This is used to specify where the Referable should be updated from and committed to.
                   Default is an empty string, making it use the source of its ancestor, if possible.
     """
+    # Class-level flag, overridden by Identifiable. It allows to distinguish Identifiables from other Referables (e.g.
+    # when walking up the parent chain) by a simple attribute lookup instead of an isinstance() check against the ABC.
+    _is_identifiable: bool = False
+
     @abc.abstractmethod
     def __init__(self):
         super().__init__()
         self._id_short: Optional[NameType] = None
-        self.display_name: Optional[MultiLanguageNameType] = dict()
+        self.display_name: Optional[MultiLanguageNameType] = None
         self._category: Optional[NameType] = None
-        self.description: Optional[MultiLanguageTextType] = dict()
+        self.description: Optional[MultiLanguageTextType] = None
         # We use a Python reference to the parent Namespace instead of a Reference Object, as specified. This allows
         # simpler and faster navigation/checks and it has no effect in the serialized data formats anyway.
         self.parent: Optional[UniqueIdShortNamespace] = None
         self.source: str = ""
+        # Monotonic timestamp of the last update of this object from its (direct or indirect) source
+        self._last_source_update: float = float("-inf")
 
     def __repr__(self) -> str:
         reversed_path = []
@@ -625,19 +672,18 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         if item.id_short is not None:
             from .submodel import SubmodelElementList
             while item is not None:
-                if isinstance(item, Identifiable):
-                    reversed_path.append(item.id)
+                if not isinstance(item, Referable):
+                    raise AttributeError('Referable must have an identifiable as root object and only parents that are '
+                                         'referable')
+                if item._is_identifiable:
+                    reversed_path.append(item.id)  # type: ignore
                     break
-                elif isinstance(item, Referable):
-                    if isinstance(item.parent, SubmodelElementList):
-                        reversed_path.append(f"{item.parent.id_short}[{item.parent.value.index(item)}]")
-                        item = item.parent
-                    else:
-                        reversed_path.append(item.id_short)
+                if isinstance(item.parent, SubmodelElementList):
+                    reversed_path.append(f"{item.parent.id_short}[{item.parent.value.index(item)}]")
                     item = item.parent
                 else:
-                    raise AttributeError('Referable must have an identifiable as root object and only parents that are '
-                                         'referable')
+                    reversed_path.append(item.id_short)
+                item = item.parent
 
         return self.__class__.__name__ + ("[{}]".format(" / ".join(reversed(reversed_path))) if reversed_path else "")
 
@@ -681,12 +727,13 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         if id_short is not None:
             _string_constraints.check_name_type(id_short)
             test_id_short: NameType = str(id_short)
-            if not re.fullmatch("[a-zA-Z0-9_]*", test_id_short):
-                raise AASConstraintViolation(
-                    2,
-                    "The id_short must contain only letters, digits and underscore"
-                )
-            if not test_id_short[0].isalpha():
+            if not _ID_SHORT_RE.fullmatch(test_id_short):
+                # Only figure out the reason for the violation in the error case, to keep the common case fast
+                if not re.fullmatch("[a-zA-Z0-9_]*", test_id_short):
+                    raise AASConstraintViolation(
+                        2,
+                        "The id_short must contain only letters, digits and underscore"
+                    )
                 raise AASConstraintViolation(
                     2,
                     "The id_short must start with a letter"
@@ -705,15 +752,9 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                     raise AASConstraintViolation(22, "Object with id_short '{}' is already present in the parent "
                                                      "Namespace".format(id_short))
 
-            set_add_list: List[NamespaceSet] = []
+            # Re-index this object in the sets containing it in place, instead of removing and re-adding it
             for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._id_short = id_short
-            for set_ in set_add_list:
-                set_.add(self)
-        # Redundant to the line above. However this way, we make sure that we really update the _id_short
+                set_._update_key(self, "id_short", self._id_short, id_short)
         self._id_short = id_short
 
     def update(self,
@@ -732,26 +773,32 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         :param _indirect_source: Internal parameter to avoid duplicate updating.
         :raises backends.BackendError: If no appropriate backend or the data source is not available
         """
-        # TODO consider max_age
-        if not _indirect_source:
+        now = time.monotonic()
+        if now - self._last_source_update < max_age:
+            # This object has been updated recently enough, so the update of the object itself can be skipped
+            pass
+        elif not _indirect_source:
             # Update was already called on an ancestor of this Referable. Only update it, if it has its own source
             if self.source != "":
                 backends.get_backend(self.source).update_object(updated_object=self,
                                                                 store_object=self,
-                                                                relative_path=[])
+                                                                relative_path=())
+                self._last_source_update = now
 
         else:
             # Try to find a valid source for this Referable
             if self.source != "":
                 backends.get_backend(self.source).update_object(updated_object=self,
                                                                 store_object=self,
-                                                                relative_path=[])
+                                                                relative_path=())
+                self._last_source_update = now
             else:
                 store_object, relative_path = self.find_source()
                 if store_object and relative_path is not None:
                     backends.get_backend(store_object.source).update_object(updated_object=self,
                                                                             store_object=store_object,
-                                                                            relative_path=list(relative_path))
+                                                                            relative_path=tuple(relative_path))
+                    self._last_source_update = now
 
         if recursive:
             # update all the children who have their own source
@@ -769,19 +816,23 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         :return: Tuple with the closest ancestor with a defined source and the relative path of id_shorts to that
                  ancestor
         """
+        # Find the closest ancestor with a source first, such that no path needs to be built, if there is none
+        store_object: Optional[Referable] = self
+        depth = 0
+        while store_object is not None and store_object.source == "":
+            assert store_object.parent is None or isinstance(store_object.parent, Referable)
+            store_object = store_object.parent
+            depth += 1
+        if store_object is None:
+            return None, None
+
+        # Fill the path of id_shorts from the store_object (inclusive) down to this object back to front
+        relative_path: List[NameType] = [""] * (depth + 1)
         referable: Referable = self
-        relative_path: List[NameType] = [self.id_short]
-        while referable is not None:
-            if referable.source != "":
-                relative_path.reverse()
-                return referable, relative_path
-            if referable.parent:
-                assert isinstance(referable.parent, Referable)
-                referable = referable.parent
-                relative_path.append(referable.id_short)
-                continue
-            break
-        return None, None
+        for i in range(depth, -1, -1):
+            relative_path[i] = referable.id_short  # type: ignore
+            referable = referable.parent  # type: ignore
+        return store_object, relative_path
 
     def update_from(self, other: "Referable", update_source: bool = False):
         """
@@ -794,15 +845,17 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         :param update_source: Update the source attribute with the other's source attribute. This is not propagated
                               recursively
         """
+        # do not update the parent, namespace_element_sets or source (depending on update_source parameter)
+        skipped_names = _UPDATE_FROM_SKIPPED_NAMES if update_source else _UPDATE_FROM_SKIPPED_NAMES_WITH_SOURCE
+        self_vars = vars(self)
         for name, var in vars(other).items():
-            # do not update the parent, namespace_element_sets or source (depending on update_source parameter)
-            if name in ("parent", "namespace_element_sets") or name == "source" and not update_source:
+            if name in skipped_names:
                 continue
-            if isinstance(var, NamespaceSet):
+            if getattr(var, "_is_namespace_set", False):
                 # update the elements of the NameSpaceSet
-                vars(self)[name].update_nss_from(var)
+                self_vars[name].update_nss_from(var)
             else:
-                vars(self)[name] = var  # that variable is not a NameSpaceSet, so it isn't Referable
+                self_vars[name] = var  # that variable is not a NameSpaceSet, so it isn't Referable
 
     def commit(self) -> None:
         """
@@ -811,17 +864,23 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         This function commits the current state of this object to its own and each external data source of its
         ancestors. If there is no source, this function will do nothing.
         """
+        ancestors: List[Referable] = []
         current_ancestor = self.parent
-        relative_path: List[NameType] = [self.id_short]
-        # Commit to all ancestors with sources
         while current_ancestor:
             assert isinstance(current_ancestor, Referable)
-            if current_ancestor.source != "":
-                backends.get_backend(current_ancestor.source).commit_object(committed_object=self,
-                                                                            store_object=current_ancestor,
-                                                                            relative_path=list(relative_path))
-            relative_path.insert(0, current_ancestor.id_short)
+            ancestors.append(current_ancestor)
             current_ancestor = current_ancestor.parent
+        # Commit to all ancestors with sources, starting with the closest one. The relative path from the k-th
+        # ancestor (counting from 0 for the parent) consists of the last k+1 id_shorts of the full path to this object.
+        full_path: Tuple[NameType, ...] = \
+            tuple(ancestor.id_short for ancestor in reversed(ancestors)) + (self.id_short,)
+        sourced_ancestors = [(k, ancestor) for k, ancestor in enumerate(ancestors) if ancestor.source != ""]
+        # Resolve the backends of all ancestors at once, before committing to any of them
+        ancestor_backends = backends.get_backends([ancestor.source for _, ancestor in sourced_ancestors])
+        for (k, ancestor), backend in zip(sourced_ancestors, ancestor_backends):
+            backend.commit_object(committed_object=self,
+                                  store_object=ancestor,
+                                  relative_path=full_path[len(full_path) - k - 1:])
         # Commit to own source and check if there are children with sources to commit to
         self._direct_source_commit()
 
@@ -829,21 +888,32 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         """
         Commits children of an ancestor recursively, if they have a specific source given
         """
-        if self.source != "":
-            backends.get_backend(self.source).commit_object(committed_object=self,
-                                                            store_object=self,
-                                                            relative_path=[])
-
-        if isinstance(self, UniqueIdShortNamespace):
-            for namespace_set in self.namespace_element_sets:
-                if "id_short" not in namespace_set.get_attribute_name_list():
-                    continue
-                for referable in namespace_set:
-                    referable._direct_source_commit()
+        # Walk the tree iteratively (depth-first, pre-order) using an explicit stack, to avoid the overhead of a
+        # Python function call per Referable and hitting the recursion limit for deeply nested objects
+        stack: List[Referable] = [self]
+        sourced_referables: List[Referable] = []
+        while stack:
+            referable = stack.pop()
+            if referable.source != "":
+                sourced_referables.append(referable)
+            if isinstance(referable, UniqueIdShortNamespace):
+                # Push the children in reverse order, so that they are committed in their original order
+                stack.extend(reversed(list(referable)))
+        # Resolve the backends of all collected Referables at once: Typically, they share only a few URI schemes
+        for referable, backend in zip(sourced_referables,
+                                      backends.get_backends([referable.source for referable in sourced_referables])):
+            backend.commit_object(committed_object=referable,
+                                  store_object=referable,
+                                  relative_path=())
 
     id_short = property(_get_id_short, _set_id_short)
 
 
+# Attributes, which are not copied by Referable.update_from()
+# The timestamp of the last backend update belongs to the updated object itself, not to the object updated from
+_UPDATE_FROM_SKIPPED_NAMES: FrozenSet[str] = frozenset(("parent", "namespace_element_sets", "_last_source_update"))
+_UPDATE_FROM_SKIPPED_NAMES_WITH_SOURCE: FrozenSet[str] = _UPDATE_FROM_SKIPPED_NAMES | {"source"}
+
 _RT = TypeVar('_RT', bound=Referable)
 
 
@@ -881,6 +951,10 @@ class Reference(metaclass=abc.ABCMeta):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    # References are immutable and very frequently instantiated. Use slots to avoid a per-instance dict. Subclasses must
+    # declare __slots__ as well, to benefit from this.
+    __slots__ = ('key', 'referred_semantic_id', '_hash')
+
     @abc.abstractmethod
     def __init__(self, key: Tuple[Key, ...], referred_semantic_id: Optional["Reference"] = None):
         if len(key) < 1:
@@ -890,22 +964,33 @@ class Reference(metaclass=abc.ABCMeta):
 
         self.key: Tuple[Key, ...]
         self.referred_semantic_id: Optional["Reference"]
+        self._hash: int
         super().__setattr__('key', key)
         super().__setattr__('referred_semantic_id', referred_semantic_id)
+        # References are immutable, so we can calculate the hash once, instead of on every lookup in a set or dict
+        super().__setattr__('_hash', hash((self.__class__, key)))
 
     def __setattr__(self, key, value):
         """Prevent modification of attributes."""
         raise AttributeError('Reference is immutable')
 
+    def __reduce__(self):
+        # copy and pickle would restore the slots via setattr(), which is prevented above. So rebuild the Reference via
+        # the constructor, as for Keys. Subclasses with additional constructor parameters must override this.
+        return self.__class__, (self.key, self.referred_semantic_id)
+
     def __hash__(self):
-        return hash((self.__class__, self.key))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        if len(self.key) != len(other.key):
+        # The hashes are precomputed, so comparing them is the cheapest way to tell apart References of the same class
+        # with different keys
+        if self._hash != other._hash and self.__class__ is other.__class__:
             return False
-        return all(k1 == k2 for k1, k2 in zip(self.key, other.key)) \
+        # Tuple comparison checks the lengths first and compares the Keys pairwise in C
+        return self.key == other.key \
             and self.referred_semantic_id == other.referred_semantic_id
 
 
@@ -929,6 +1014,7 @@ class ExternalReference(Reference):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    __slots__ = ()
 
     def __init__(self, key: Tuple[Key, ...], referred_semantic_id: Optional["Reference"] = None):
         super().__init__(key, referred_semantic_id)
@@ -978,6 +1064,8 @@ class ModelReference(Reference, Generic[_RT]):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    __slots__ = ('type',)
+
     def __init__(self, key: Tuple[Key, ...], type_: Type[_RT], referred_semantic_id: Optional[Reference] = None):
         super().__init__(key, referred_semantic_id)
 
@@ -994,9 +1082,9 @@ class ModelReference(Reference, Generic[_RT]):
                     raise AASConstraintViolation(126, f"Key {k!r} is a GenericFragmentKey, "
                                                       f"but the last key of the chain is not: {key[-1]!r}")
         for pk, k in zip(key, key[1:]):
-            if k.type == KeyTypes.FRAGMENT_REFERENCE and pk.type not in (KeyTypes.BLOB, KeyTypes.FILE):
+            if k.type is KeyTypes.FRAGMENT_REFERENCE and pk.type is not KeyTypes.BLOB and pk.type is not KeyTypes.FILE:
                 raise AASConstraintViolation(127, f"{k!r} is not preceeded by a key of type File or Blob, but {pk!r}")
-            if pk.type == KeyTypes.SUBMODEL_ELEMENT_LIST and not k.value.isnumeric():
+            if pk.type is KeyTypes.SUBMODEL_ELEMENT_LIST and not k.value.isnumeric():
                 raise AASConstraintViolation(128, f"Key {pk!r} references a SubmodelElementList, "
                                                   f"but the value of the succeeding key ({k!r}) is not a non-negative "
                                                   f"integer: {k.value}")
@@ -1069,14 +1157,15 @@ class ModelReference(Reference, Generic[_RT]):
         :returns: :class:`Identifier`
         :raises ValueError: If this :class:`~.ModelReference` does not include a Key of AasIdentifiable type
         """
-        try:
-            last_identifier = next(key.get_identifier()
-                                   for key in reversed(self.key)
-                                   if key.get_identifier())
-            return last_identifier  # type: ignore  # MyPy doesn't get the generator expression above
-        except StopIteration:
-            raise ValueError("ModelReference cannot be represented as an Identifier, since it does not contain a Key"
-                             f" of an AasIdentifiable type ({[t.name for t in KeyTypes if t.is_aas_identifiable]})")
+        for key in reversed(self.key):
+            identifier = key.get_identifier()
+            if identifier:
+                return identifier
+        raise ValueError("ModelReference cannot be represented as an Identifier, since it does not contain a Key"
+                         f" of an AasIdentifiable type ({[t.name for t in KeyTypes if t.is_aas_identifiable]})")
+
+    def __reduce__(self):
+        return self.__class__, (self.key, self.type, self.referred_semantic_id)
 
     def __repr__(self) -> str:
         return "ModelReference<{}>(key={})".format(self.type.__name__, self.key)
@@ -1097,18 +1186,24 @@ class ModelReference(Reference, Generic[_RT]):
         :raises ValueError: If no :class:`~basyx.aas.model.base.Identifiable` object is found while traversing the
                             object's ancestors
         """
-        # Get the first class from the base classes list (via inspect.getmro), that is contained in KEY_ELEMENTS_CLASSES
-        from . import KEY_TYPES_CLASSES
-        try:
-            ref_type = next(iter(t for t in inspect.getmro(type(referable)) if t in KEY_TYPES_CLASSES))
-        except StopIteration:
+        # Get the first class from the base classes list (via __mro__), that is contained in KEY_TYPES_CLASSES. The
+        # result only depends on the class of the referable, so it is cached per class.
+        referable_type = type(referable)
+        ref_type = _REFERENCE_TYPE_BY_CLASS.get(referable_type)
+        if ref_type is None:
+            from . import KEY_TYPES_CLASSES
             ref_type = Referable
+            for t in referable_type.__mro__:
+                if t in KEY_TYPES_CLASSES:
+                    ref_type = t
+                    break
+            _REFERENCE_TYPE_BY_CLASS[referable_type] = ref_type
 
         ref: Referable = referable
         keys: List[Key] = []
         while True:
             keys.append(Key.from_referable(ref))
-            if isinstance(ref, Identifiable):
+            if ref._is_identifiable:
                 keys.reverse()
                 return ModelReference(tuple(keys), ref_type)
             if ref.parent is None or not isinstance(ref.parent, Referable):
@@ -1116,6 +1211,11 @@ class ModelReference(Reference, Generic[_RT]):
             ref = ref.parent
 
 
+# Cache for ModelReference.from_referable(), mapping each concrete Referable class to its first base class found in
+# KEY_TYPES_CLASSES, which is used as the type of the ModelReference.
+_REFERENCE_TYPE_BY_CLASS: Dict[type, type] = {}
+
+
 @_string_constraints.constrain_content_type("content_type")
 @_string_constraints.constrain_path_type("path")
 class Resource:
@@ -1278,6 +1378,8 @@ class Identifiable(Referable, metaclass=abc.ABCMeta):
     :ivar administration: :class:`~.AdministrativeInformation` of an identifiable element.
     :ivar id: The globally unique id of the element.
     """
+    _is_identifiable = True
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
@@ -1435,19 +1537,23 @@ class HasSemantics(metaclass=abc.ABCMeta):
             raise AASConstraintViolation(118, "semantic_id can not be removed while there is at least one "
                                               f"supplemental_semantic_id: {self.supplemental_semantic_id!r}")
         if self.parent is not None:
+            # Skip the namespace checks for no-op assignments, which would otherwise collide with this object itself
+            if semantic_id is self._semantic_id or semantic_id == self._semantic_id:
+                return
             if semantic_id is not None:
                 for set_ in self.parent.namespace_element_sets:
                     if set_.contains_id("semantic_id", semantic_id):
                         raise KeyError("Object with semantic_id is already present in the parent Namespace")
-            set_add_list: List[NamespaceSet] = []
-            for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._semantic_id = semantic_id
-            for set_ in set_add_list:
-                set_.add(self)
-        # Redundant to the line above. However this way, we make sure that we really update the _semantic_id
+            old_semantic_id = self._semantic_id
+            namespace_element_sets = self.parent.namespace_element_sets
+            for set_ in namespace_element_sets:
+                if set_._item_add_hook is not None and self in set_:
+                    # The item_add_hook may validate the semantic_id (e.g. AASd-107 and AASd-114 in
+                    # SubmodelElementLists), so the object must be re-added through the hooks of such sets
+                    set_._re_add(self, "semantic_id", semantic_id)
+            # Re-index this object in the other sets containing it in place, instead of removing and re-adding it
+            for set_ in namespace_element_sets:
+                set_._update_key(self, "semantic_id", old_semantic_id, semantic_id)
         self._semantic_id = semantic_id
 
     @property
@@ -1515,19 +1621,16 @@ class Extension(HasSemantics):
     def name(self, name: NameType) -> None:
         _string_constraints.check_name_type(name)
         if self.parent is not None:
+            # No-op assignment (see HasSemantics.semantic_id)
+            if name == self._name:
+                return
             for set_ in self.parent.namespace_element_sets:
                 if set_.contains_id("name", name):
                     raise KeyError("Object with name '{}' is already present in the parent Namespace"
                                    .format(name))
-            set_add_list: List[NamespaceSet] = []
+            # Re-index this object in the sets containing it in place, instead of removing and re-adding it
             for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._name = name
-            for set_ in set_add_list:
-                set_.add(self)
-        # Redundant to the line above. However this way, we make sure that we really update the _name
+                set_._update_key(self, "name", self._name, name)
         self._name = name
 
 
@@ -1658,19 +1761,16 @@ class Qualifier(HasSemantics):
     def type(self, type_: QualifierType) -> None:
         _string_constraints.check_qualifier_type(type_)
         if self.parent is not None:
+            # No-op assignment (see HasSemantics.semantic_id)
+            if type_ == self._type:
+                return
             for set_ in self.parent.namespace_element_sets:
                 if set_.contains_id("type", type_):
                     raise KeyError("Object with type '{}' is already present in the parent Namespace"
                                    .format(type_))
-            set_add_list: List[NamespaceSet] = []
+            # Re-index this object in the sets containing it in place, instead of removing and re-adding it
             for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._type = type_
-            for set_ in set_add_list:
-                set_.add(self)
-        # Redundant to the line above. However this way, we make sure that we really update the _type
+                set_._update_key(self, "type", self._type, type_)
         self._type = type_
 
 
@@ -1747,14 +1847,8 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
         return super()._remove_object(Referable, "id_short", id_short)
 
     def __iter__(self) -> Iterator[Referable]:
-        namespace_set_list: List[NamespaceSet] = []
-        for namespace_set in self.namespace_element_sets:
-            if len(namespace_set) == 0:
-                namespace_set_list.append(namespace_set)
-                continue
-            if "id_short" in namespace_set.get_attribute_name_list():
-                namespace_set_list.append(namespace_set)
-        return itertools.chain.from_iterable(namespace_set_list)
+        return itertools.chain.from_iterable(namespace_set for namespace_set in self.namespace_element_sets
+                                             if "id_short" in namespace_set._backend)
 
 
 class UniqueSemanticIdNamespace(Namespace, metaclass=abc.ABCMeta):
@@ -1791,6 +1885,27 @@ class UniqueSemanticIdNamespace(Namespace, metaclass=abc.ABCMeta):
 
 ATTRIBUTE_TYPES = Union[NameType, Reference, QualifierType]
 
+# Sentinel for attributes missing on an object, used with getattr() by the NamespaceSets
+_MISSING = object()
+
+
+def _key_getter(attr_name: str, case_sensitive: bool) -> Callable[[object], ATTRIBUTE_TYPES]:
+    """
+    Compile the function, which extracts the backend key of an object for a NamespaceSet attribute
+
+    For case-sensitive attributes, this is a plain :func:`operator.attrgetter`, so no Python-level call and no case
+    sensitivity check is required per object.
+    """
+    getter = operator.attrgetter(attr_name)
+    if case_sensitive:
+        return getter
+
+    def upper_getter(x: object) -> ATTRIBUTE_TYPES:
+        attr_value = getter(x)
+        return attr_value.upper() if isinstance(attr_value, str) else attr_value
+    return upper_getter
+
+
 # TODO: Find a better solution for providing constraint ids
 ATTRIBUTES_CONSTRAINT_IDS = {
     "id_short": 22,  # Referable,
@@ -1824,6 +1939,10 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
 
     :raises KeyError: When ``items`` contains multiple objects with same unique attribute
     """
+    # Class-level flag to recognize NamespaceSets (e.g. in Referable.update_from()) by a simple attribute lookup instead
+    # of an isinstance() check against this ABC-derived class
+    _is_namespace_set = True
+
     def __init__(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
                  attribute_names: List[Tuple[str, bool]], items: Iterable[_NSO] = (),
                  item_add_hook: Optional[Callable[[_NSO, Iterable[_NSO]], None]] = None,
@@ -1856,47 +1975,48 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         self._item_add_hook: Optional[Callable[[_NSO, Iterable[_NSO]], None]] = item_add_hook
         self._item_id_set_hook: Optional[Callable[[_NSO], None]] = item_id_set_hook
         self._item_id_del_hook: Optional[Callable[[_NSO], None]] = item_id_del_hook
+        # (backend dict, key getter) pairs in the order of self._backend, used when (un)indexing objects
+        self._key_getters: List[Tuple[Dict[ATTRIBUTE_TYPES, _NSO], Callable[[object], ATTRIBUTE_TYPES]]] = []
         for name, case_sensitive in attribute_names:
             self._backend[name] = ({}, case_sensitive)
+            self._key_getters.append((self._backend[name][0], _key_getter(name, case_sensitive)))
+        # All backends contain the same objects, so the first one is used for length, iteration, etc.
+        self._primary_backend: Dict[ATTRIBUTE_TYPES, _NSO] = self._backend[attribute_names[0][0]][0]
+        items = list(items)
         try:
-            for i in items:
-                self.add(i)
+            if not self._bulk_add(items):
+                for i in items:
+                    self.add(i)
         except Exception:
             # Do a rollback, when an exception occurs while adding items
             self.clear()
             raise
 
-    @staticmethod
-    def _get_attribute(x: object, attr_name: str, case_sensitive: bool):
-        attr_value = getattr(x, attr_name)
-        return attr_value if case_sensitive or not isinstance(attr_value, str) else attr_value.upper()
-
     def get_attribute_name_list(self) -> List[str]:
         return list(self._backend.keys())
 
     def contains_id(self, attribute_name: str, identifier: ATTRIBUTE_TYPES) -> bool:
-        try:
-            backend, case_sensitive = self._backend[attribute_name]
-        except KeyError:
+        if attribute_name not in self._backend:
             return False
+        backend, case_sensitive = self._backend[attribute_name]
         # if the identifier is not a string we ignore the case sensitivity
         if case_sensitive or not isinstance(identifier, str):
             return identifier in backend
         return identifier.upper() in backend
 
     def __contains__(self, obj: object) -> bool:
-        attr_name = next(iter(self._backend))
+        backend, key_getter = self._key_getters[0]
         try:
-            attr_value = self._get_attribute(obj, attr_name, self._backend[attr_name][1])
+            attr_value = key_getter(obj)
         except AttributeError:
             return False
-        return self._backend[attr_name][0].get(attr_value) is obj
+        return backend.get(attr_value) is obj
 
     def __len__(self) -> int:
-        return len(next(iter(self._backend.values()))[0])
+        return len(self._primary_backend)
 
     def __iter__(self) -> Iterator[_NSO]:
-        return iter(next(iter(self._backend.values()))[0].values())
+        return iter(self._primary_backend.values())
 
     def add(self, element: _NSO):
         if element.parent is not None and element.parent is not self.parent:
@@ -1908,15 +2028,60 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         self._execute_item_add_hook(element)
 
         element.parent = self.parent
-        for key_attr_name, (backend, case_sensitive) in self._backend.items():
-            backend[self._get_attribute(element, key_attr_name, case_sensitive)] = element
+        for backend, key_getter in self._key_getters:
+            backend[key_getter(element)] = element
+
+    def _bulk_add(self, items: List[_NSO]) -> bool:
+        """
+        Add multiple objects at once, using bulk dict/set operations instead of calling :meth:`add` per object
+
+        This is only possible if no hooks are set and all objects fulfill the namespace constraints. Otherwise, nothing
+        is changed and False is returned, so the objects can be added one by one via :meth:`add`, which raises the
+        respective error.
+
+        :return: True, if the objects have been added
+        """
+        if self._item_id_set_hook is not None or self._item_add_hook is not None \
+                or any(item.parent is not None for item in items):
+            return False
+        keys_per_backend: List[List[ATTRIBUTE_TYPES]] = []
+        for backend, key_getter in self._key_getters:
+            try:
+                keys = [key_getter(item) for item in items]
+            except AttributeError:
+                return False
+            if any(key is None for key in keys) or len(set(keys)) != len(keys) or not backend.keys().isdisjoint(keys):
+                return False
+            keys_per_backend.append(keys)
+        for set_ in self.parent.namespace_element_sets:
+            if set_ is self:
+                continue
+            for key_attr_name, (backend_dict, case_sensitive) in set_._backend.items():
+                values = [getattr(item, key_attr_name, _MISSING) for item in items]
+                if not case_sensitive:
+                    values = [value.upper() if isinstance(value, str) else value for value in values]
+                if any(value is None for value in values) or not backend_dict.keys().isdisjoint(values):
+                    return False
+
+        for item in items:
+            item.parent = self.parent
+        for (backend, _), keys in zip(self._key_getters, keys_per_backend):
+            backend.update(zip(keys, items))
+        return True
 
     def _validate_namespace_constraints(self, element: _NSO):
+        # This runs for every added object against every set of the namespace. Thus, the attribute is fetched only once
+        # (instead of hasattr() + getattr()) and the checks are only delegated to the helper methods in the error case.
         for set_ in self.parent.namespace_element_sets:
             for key_attr_name, (backend_dict, case_sensitive) in set_._backend.items():
-                if hasattr(element, key_attr_name):
-                    key_attr_value = self._get_attribute(element, key_attr_name, case_sensitive)
+                key_attr_value = getattr(element, key_attr_name, _MISSING)
+                if key_attr_value is _MISSING:
+                    continue
+                if not case_sensitive and isinstance(key_attr_value, str):
+                    key_attr_value = key_attr_value.upper()
+                if key_attr_value is None:
                     self._check_attr_is_not_none(element, key_attr_name, key_attr_value)
+                if key_attr_value in backend_dict:
                     self._check_value_is_not_in_backend(element, key_attr_name, key_attr_value, backend_dict, set_)
 
     def _check_attr_is_not_none(self, element: _NSO, attr_name: str, attr):
@@ -1958,40 +2123,121 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         if self._item_id_del_hook is not None:
             self._item_id_del_hook(element)
 
+    def _update_key(self, element: _NSO, attribute_name: str, old_value: Optional[ATTRIBUTE_TYPES],
+                    new_value: Optional[ATTRIBUTE_TYPES]) -> None:
+        """
+        Re-index an object of this set after the value of one of its unique attributes has changed.
+
+        The object keeps its position in the set. Neither the item hooks nor the namespace constraint checks are
+        executed, so the caller is responsible for making sure, that the new value is unique within the namespace.
+        Does nothing, if the object is not contained in this set or the set is not indexed by the given attribute.
+
+        :param element: The object, whose attribute changes
+        :param attribute_name: The name of the changed attribute
+        :param old_value: The value of the attribute, under which the object is currently stored in this set
+        :param new_value: The new value of the attribute
+        :raises ValueError: If the object is contained in this set and the new value is None
+        """
+        if old_value is None or attribute_name not in self._backend:
+            return
+        backend, case_sensitive = self._backend[attribute_name]
+        if not case_sensitive:
+            old_value = old_value.upper() if isinstance(old_value, str) else old_value
+            new_value = new_value.upper() if isinstance(new_value, str) else new_value
+        if backend.get(old_value) is not element:
+            return
+        if new_value is None:
+            raise ValueError(f"{element!r} has attribute {attribute_name}=None, which is not allowed!")
+        del backend[old_value]
+        backend[new_value] = element
+
+    def _re_add(self, element: _NSO, attribute_name: str, new_value: Optional[ATTRIBUTE_TYPES]) -> None:
+        """
+        Change an attribute of an object of this set by removing the object, setting the attribute and adding the
+        object again, such that the hooks of this set run for the changed object.
+
+        This is required instead of :meth:`_update_key`, if the ``item_add_hook`` of this set validates the attribute.
+        If the changed object is rejected, the old value of the attribute is restored and the object is added again.
+
+        :param element: The object contained in this set
+        :param attribute_name: The name of the attribute to change. It is set via its private counterpart (with a
+                               leading underscore), to bypass the setter, which calls this method.
+        :param new_value: The new value of the attribute
+        """
+        private_attribute_name = "_" + attribute_name
+        old_value = getattr(element, private_attribute_name)
+        position = self._position_of(element)
+        self.remove(element)
+        setattr(element, private_attribute_name, new_value)
+        try:
+            self._add_at(element, position)
+        except Exception:
+            setattr(element, private_attribute_name, old_value)
+            self._add_at(element, position)
+            raise
+
+    def _position_of(self, element: _NSO) -> Optional[int]:
+        # NamespaceSets are unordered, see OrderedNamespaceSet
+        return None
+
+    def _add_at(self, element: _NSO, position: Optional[int]) -> None:
+        self.add(element)
+
     def remove_by_id(self, attribute_name: str, identifier: ATTRIBUTE_TYPES) -> None:
         item = self.get_object_by_attribute(attribute_name, identifier)
         self.remove(item)
 
     def remove(self, item: _NSO) -> None:
-        item_found = False
-        for key_attr_name, (backend_dict, case_sensitive) in self._backend.items():
-            key_attr_value = self._get_attribute(item, key_attr_name, case_sensitive)
-            if backend_dict[key_attr_value] is item:
-                # item has to be removed from backend before _item_del_hook() is called,
-                # as the hook may unset the id_short, as in SubmodelElementLists
-                del backend_dict[key_attr_value]
-                item_found = True
-        if not item_found:
-            raise KeyError("Object not found in NamespaceDict")
+        # item has to be removed from backend before _item_del_hook() is called,
+        # as the hook may unset the id_short, as in SubmodelElementLists
+        self._remove_from_backends(item)
         self._execute_item_del_hook(item)
 
+    def _remove_from_backends(self, item: _NSO) -> None:
+        """
+        Internal function to remove an object from the backends of this set, without executing the item_del_hook.
+
+        :raises KeyError: If the object is not contained in this set
+        :raises AttributeError: If the object does not have the unique attributes of this set
+        """
+        if len(self._key_getters) == 1:
+            # Fast path for the common case of a single unique attribute (all NamespaceSets of the metamodel)
+            key_attr_value = self._key_getters[0][1](item)
+            if self._primary_backend.get(key_attr_value) is not item:
+                raise KeyError("Object not found in NamespaceDict")
+            del self._primary_backend[key_attr_value]
+        else:
+            keys = [key_getter(item) for _, key_getter in self._key_getters]
+            for (backend_dict, _), key_attr_value in zip(self._key_getters, keys):
+                if backend_dict.get(key_attr_value) is not item:
+                    raise KeyError("Object not found in NamespaceDict")
+            for (backend_dict, _), key_attr_value in zip(self._key_getters, keys):
+                del backend_dict[key_attr_value]
+
     def discard(self, x: _NSO) -> None:
-        if x not in self:
+        # Removing x checks whether x is contained anyway, so don't look it up twice. An AttributeError is raised, if x
+        # doesn't even have the unique attributes of this set. Exceptions of the item_del_hook are not suppressed.
+        try:
+            self._remove_from_backends(x)
+        except (KeyError, AttributeError):
             return
-        self.remove(x)
+        self._execute_item_del_hook(x)
 
     def pop(self) -> _NSO:
-        _, value = next(iter(self._backend.values()))[0].popitem()
+        _, value = self._primary_backend.popitem()
+        for backend, key_getter in self._key_getters[1:]:
+            del backend[key_getter(value)]
         self._execute_item_del_hook(value)
         value.parent = None
         return value
 
     def clear(self) -> None:
-        for attr_name, (backend, case_sensitive) in self._backend.items():
-            for value in backend.values():
-                self._execute_item_del_hook(value)
-        for attr_name, (backend, case_sensitive) in self._backend.items():
+        # The hook is only executed once per object, as all backends contain the same objects
+        values = list(self._primary_backend.values())
+        for backend, _ in self._key_getters:
             backend.clear()
+        for value in values:
+            self._execute_item_del_hook(value)
 
     def get_object_by_attribute(self, attribute_name: str, attribute_value: ATTRIBUTE_TYPES) -> _NSO:
         """
@@ -2026,6 +2272,7 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         """
         objects_to_add: List[_NSO] = []  # objects from the other nss to add to self
         objects_to_remove: List[_NSO] = []  # objects to remove from self
+        ids_to_remove: Set[int] = set()  # ids of objects_to_remove, as an object may be missing for multiple attributes
         for other_object in other:
             try:
                 if isinstance(other_object, Referable):
@@ -2045,13 +2292,17 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
             except KeyError:
                 # other object is not in NamespaceSet
                 objects_to_add.append(other_object)
-        for attr_name, (backend, case_sensitive) in self._backend.items():
-            for attr_name_other, (backend_other, case_sensitive_other) in other._backend.items():
-                if attr_name is attr_name_other:
-                    for item in backend.values():
-                        if not backend_other.get(self._get_attribute(item, attr_name, case_sensitive)):
-                            # referable does not exist in the other NamespaceSet
-                            objects_to_remove.append(item)
+        for attr_name, (backend, _) in self._backend.items():
+            if attr_name not in other._backend:
+                continue
+            backend_other = other._backend[attr_name][0]
+            # The backend keys are already normalized, so the objects, which do not exist in the other NamespaceSet,
+            # can be found via a key set difference
+            for key in backend.keys() - backend_other.keys():
+                item = backend[key]
+                if id(item) not in ids_to_remove:
+                    ids_to_remove.add(id(item))
+                    objects_to_remove.append(item)
         for object_to_add in objects_to_add:
             other.remove(object_to_add)
             self.add(object_to_add)  # type: ignore
@@ -2094,38 +2345,106 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
         :raises AASConstraintViolation: When ``items`` contains multiple objects with same unique attribute or when an
                                         item doesn't has an identifying attribute
         """
-        self._order: List[_NSO] = []
+        # The order is kept in two representations, which are built lazily from each other, such that at least one of
+        # them is always present: A dict by object id, which preserves the insertion order and allows removing objects
+        # in O(1), and a list for index-based access and modification. Each one is only rebuilt when required after the
+        # other one has been modified.
+        self._order: Optional[Dict[int, _NSO]] = {}
+        self._order_list: Optional[List[_NSO]] = None
         super().__init__(parent, attribute_names, items, item_add_hook, item_id_set_hook, item_id_del_hook)
 
+    def _get_order_list(self) -> List[_NSO]:
+        if self._order_list is None:
+            assert self._order is not None
+            self._order_list = list(self._order.values())
+        return self._order_list
+
+    def _get_order_dict(self) -> Dict[int, _NSO]:
+        if self._order is None:
+            assert self._order_list is not None
+            self._order = {id(o): o for o in self._order_list}
+        return self._order
+
+    def _set_order_list(self, order_list: List[_NSO]) -> None:
+        # The list has been modified at some position, so the dict needs to be rebuilt when it's needed the next time
+        self._order_list = order_list
+        self._order = None
+
+    def _append_to_order(self, element: _NSO) -> None:
+        if self._order is not None:
+            self._order[id(element)] = element
+        if self._order_list is not None:
+            self._order_list.append(element)
+
+    def _remove_from_order(self, element: _NSO) -> None:
+        del self._get_order_dict()[id(element)]
+        self._order_list = None
+
     def __iter__(self) -> Iterator[_NSO]:
-        return iter(self._order)
+        if self._order_list is not None:
+            return iter(self._order_list)
+        return iter(self._get_order_dict().values())
+
+    def _position_of(self, element: _NSO) -> Optional[int]:
+        for i, o in enumerate(self._get_order_list()):
+            if o is element:
+                return i
+        return None
+
+    def _add_at(self, element: _NSO, position: Optional[int]) -> None:
+        if position is None:
+            self.add(element)
+        else:
+            self.insert(position, element)
+
+    def _bulk_add(self, items: List[_NSO]) -> bool:
+        if not super()._bulk_add(items):
+            return False
+        for item in items:
+            self._append_to_order(item)
+        return True
 
     def add(self, element: _NSO):
         super().add(element)
-        self._order.append(element)
+        self._append_to_order(element)
 
     def remove(self, item: Union[Tuple[str, ATTRIBUTE_TYPES], _NSO]):
         if isinstance(item, tuple):
             item = self.get_object_by_attribute(item[0], item[1])
         super().remove(item)
-        self._order.remove(item)
+        self._remove_from_order(item)
+
+    def discard(self, x: _NSO) -> None:
+        try:
+            self._remove_from_backends(x)
+        except (KeyError, AttributeError):
+            return
+        self._remove_from_order(x)
+        self._execute_item_del_hook(x)
 
     def pop(self, i: Optional[int] = None) -> _NSO:
         if i is None:
             value = super().pop()
-            self._order.remove(value)
         else:
-            value = self._order.pop(i)
+            value = self._get_order_list()[i]
             super().remove(value)
+        self._remove_from_order(value)
         return value
 
     def clear(self) -> None:
         super().clear()
-        self._order.clear()
+        self._order = {}
+        self._order_list = None
 
     def insert(self, index: int, object_: _NSO) -> None:
         super().add(object_)
-        self._order.insert(index, object_)
+        if index >= len(self) - 1:
+            # Appending (e.g. via append() or extend()) does not require rebuilding the order
+            self._append_to_order(object_)
+            return
+        order_list = self._get_order_list()
+        order_list.insert(index, object_)
+        self._set_order_list(order_list)
 
     @overload
     def __getitem__(self, i: int) -> _NSO: ...
@@ -2134,7 +2453,7 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __getitem__(self, s: slice) -> MutableSequence[_NSO]: ...
 
     def __getitem__(self, s: Union[int, slice]) -> Union[_NSO, MutableSequence[_NSO]]:
-        return self._order[s]
+        return self._get_order_list()[s]
 
     @overload
     def __setitem__(self, i: int, o: _NSO) -> None: ...
@@ -2143,26 +2462,37 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __setitem__(self, s: slice, o: Iterable[_NSO]) -> None: ...
 
     def __setitem__(self, s, o) -> None:
+        order_list = self._get_order_list()
         if isinstance(s, int):
-            deleted_items = [self._order[s]]
-            super().add(o)
-            self._order[s] = o
+            deleted_items = [order_list[s]]
+            new_items = [o]
         else:
-            deleted_items = self._order[s]
-            new_items = itertools.islice(o, len(deleted_items))
-            successful_new_items = []
-            try:
-                for i in new_items:
-                    super().add(i)
-                    successful_new_items.append(i)
-            except Exception:
-                # Do a rollback, when an exception occurs while adding items
-                for i in successful_new_items:
-                    super().remove(i)
-                raise
-            self._order[s] = new_items
+            deleted_items = order_list[s]
+            new_items = list(itertools.islice(o, len(deleted_items)))
+            if s.step not in (None, 1) and len(new_items) != len(deleted_items):
+                # Check this upfront (as the assignment to order_list below would fail), before modifying the backends
+                raise ValueError(f"attempt to assign sequence of size {len(new_items)} to extended slice of size "
+                                 f"{len(deleted_items)}")
+        # The replaced items are removed first, so the new items may take over their unique attributes
         for i in deleted_items:
             super().remove(i)
+        successful_new_items = []
+        try:
+            for i in new_items:
+                super().add(i)
+                successful_new_items.append(i)
+        except Exception:
+            # Do a rollback, when an exception occurs while adding items
+            for i in successful_new_items:
+                super().remove(i)
+            for i in deleted_items:
+                super().add(i)
+            raise
+        if isinstance(s, int):
+            order_list[s] = o
+        else:
+            order_list[s] = new_items
+        self._set_order_list(order_list)
 
     @overload
     def __delitem__(self, i: int) -> None: ...
@@ -2171,11 +2501,19 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __delitem__(self, i: slice) -> None: ...
 
     def __delitem__(self, i: Union[int, slice]) -> None:
+        order_list = self._get_order_list()
         if isinstance(i, int):
-            i = slice(i, i+1)
-        for o in self._order[i]:
+            # Deleting a single item doesn't require rebuilding the order, the cached list is updated in place
+            item = order_list[i]
+            super().remove(item)
+            del order_list[i]
+            if self._order is not None:
+                del self._order[id(item)]
+            return
+        for o in order_list[i]:
             super().remove(o)
-        del self._order[i]
+        del order_list[i]
+        self._set_order_list(order_list)
 
 
 class SpecificAssetId(HasSemantics):
@@ -2212,12 +2550,15 @@ class SpecificAssetId(HasSemantics):
         self.name: LabelType
         self.value: Identifier
         self.external_subject_id: ExternalReference
+        self._hash: int
 
         super().__setattr__('name', name)
         super().__setattr__('value', value)
         super().__setattr__('external_subject_id', external_subject_id)
         super().__setattr__('semantic_id', semantic_id)
         super().__setattr__('supplemental_semantic_id', supplemental_semantic_id)
+        # The hashed attributes are immutable, so the hash is computed only once
+        super(HasSemantics, self).__setattr__('_hash', hash((name, value, external_subject_id)))
 
     def __setattr__(self, key, value):
         """Prevent modification of attributes."""
@@ -2239,7 +2580,13 @@ class SpecificAssetId(HasSemantics):
                 and self.supplemental_semantic_id == other.supplemental_semantic_id)
 
     def __hash__(self):
-        return hash((self.name, self.value, self.external_subject_id))
+        return self._hash
+
+    def __reduce__(self):
+        # The cached hash is only valid within the current process (string hashes are randomized), so rebuild the
+        # SpecificAssetId via the constructor, as for Keys and References
+        return self.__class__, (self.name, self.value, self.external_subject_id, self.semantic_id,
+                                tuple(self.supplemental_semantic_id))
 
     def __repr__(self) -> str:
         return "SpecificAssetId(key={}, value={}, external_subject_id={}, " \
@@ -2258,7 +2605,7 @@ class AASConstraintViolation(Exception):
     """
     def __init__(self, constraint_id: int, message: str):
         self.constraint_id: int = constraint_id
-        self.message: str = message + " (Constraint AASd-" + str(constraint_id).zfill(3) + ")"
+        self.message: str = f"{message} (Constraint AASd-{constraint_id:03d})"
         super().__init__(self.message)
 
 
@@ -5,20 +5,21 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import List
+from typing import Tuple
 import unittest
+from unittest import mock
 
 from basyx.aas.backend import backends
 from basyx.aas.model import Referable
 
 
 class ExampleBackend(backends.Backend):
-    @classmethod
-    def commit_object(cls, committed_object: Referable, store_object: Referable, relative_path: List[str]) -> None:
+    @staticmethod
+    def commit_object(committed_object: Referable, store_object: Referable, relative_path: Tuple[str, ...]) -> None:
         raise NotImplementedError("This is a mock")
 
-    @classmethod
-    def update_object(cls, updated_object: Referable, store_object: Referable, relative_path: List[str]) -> None:
+    @staticmethod
+    def update_object(updated_object: Referable, store_object: Referable, relative_path: Tuple[str, ...]) -> None:
         raise NotImplementedError("This is a mock")
 
 
@@ -27,10 +28,76 @@ class BackendsTest(unittest.TestCase):
         backends.register_backend("mockScheme", ExampleBackend)
         self.assertIs(backends.get_backend("mockScheme:x-test:test_backend"), ExampleBackend)
 
-        backends.register_backend("<this is totally a valid uri>", ExampleBackend)
+        with self.assertRaises(ValueError) as cm:
+            backends.register_backend("<this is totally a valid uri>", ExampleBackend)
+        self.assertEqual("'<this is totally a valid uri>' is not a valid URI scheme.", str(cm.exception))
+        with self.assertRaises(ValueError):
+            backends.register_backend("mÖckScheme", ExampleBackend)
+        with self.assertRaises(ValueError):
+            backends.register_backend("mockScheme:", ExampleBackend)
+
         with self.assertRaises(ValueError) as cm:
             backends.get_backend("<this is totally a valid uri>")
-        self.assertEqual("<this is totally a valid uri> is not a valid URL with URI scheme.", str(cm.exception))
+        self.assertEqual("'<this is totally a valid uri>' is not a valid URL with URI scheme.", str(cm.exception))
+
+        with self.assertRaises(ValueError) as cm:
+            backends.get_backend("1mockScheme:x-test:test_backend")
+        self.assertEqual("'1mockScheme:x-test:test_backend' is not a valid URL with URI scheme.", str(cm.exception))
+        with self.assertRaises(ValueError):
+            backends.get_backend("mock Scheme:x-test:test_backend")
 
         with self.assertRaises(backends.UnknownBackendException):
             backends.get_backend("some-unkown-scheme://example.com")
+        with self.assertRaises(backends.UnknownBackendException):
+            backends.get_backend("opc.tcp2://example.com")
+        with self.assertRaises(ValueError):
+            backends.get_backend("mÖckScheme://example.com")
+
+    def test_get_backends(self):
+        class OtherExampleBackend(ExampleBackend):
+            pass
+
+        backends.register_backend("mockScheme", ExampleBackend)
+        backends.register_backend("otherMockScheme", OtherExampleBackend)
+        self.assertEqual([ExampleBackend, OtherExampleBackend, ExampleBackend],
+                         backends.get_backends(["mockScheme:x-test:a", "otherMockScheme:x-test:b",
+                                                "mockScheme:x-test:c"]))
+        self.assertEqual([], backends.get_backends([]))
+
+        with self.assertRaises(ValueError):
+            backends.get_backends(["mockScheme:x-test:a", "<this is totally a valid uri>"])
+        with self.assertRaises(backends.UnknownBackendException):
+            backends.get_backends(["mockScheme:x-test:a", "some-unkown-scheme://example.com"])
+
+    def test_uri_scheme_regex(self):
+        self.assertEqual("opc.tcp2", backends.RE_URI_SCHEME.match("opc.tcp2://example.com", 0)[1])  # type: ignore
+        self.assertIsNone(backends.RE_URI_SCHEME.match("mÖckScheme://example.com", 0))
+        self.assertIsNone(backends.RE_URI_SCHEME.match("2mock://example.com", 0))
+
+    def test_backend_reregistration(self):
+        class OtherExampleBackend(ExampleBackend):
+            pass
+
+        backends.register_backend("mockScheme", ExampleBackend)
+        self.assertIs(backends.get_backend("mockScheme:x-test:test_backend"), ExampleBackend)
+        backends.register_backend("mockScheme", OtherExampleBackend)
+        self.assertIs(backends.get_backend("mockScheme:x-test:test_backend"), OtherExampleBackend)
+        backends.register_backend("mockScheme", ExampleBackend)
+
+    def test_reregistration_during_lookup(self):
+        class OtherExampleBackend(ExampleBackend):
+            pass
+
+        backends.register_backend("mockScheme", ExampleBackend)
+        get_uri_scheme = backends._get_uri_scheme
+
+        def register_during_lookup(url: str) -> str:
+            # Simulates another thread registering a backend, while get_backend() resolves the url with the old registry
+            backends.register_backend("mockScheme", OtherExampleBackend)
+            return get_uri_scheme(url)
+
+        with mock.patch.object(backends, "_get_uri_scheme", side_effect=register_during_lookup):
+            self.assertIs(backends.get_backend("mockScheme:x-test:race"), ExampleBackend)
+        # The outdated result must not be cached for the new registry
+        self.assertIs(backends.get_backend("mockScheme:x-test:race"), OtherExampleBackend)
+        backends.register_backend("mockScheme", ExampleBackend)
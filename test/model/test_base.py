@@ -5,9 +5,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 from unittest import mock
-from typing import Callable, Dict, Iterable, List, Optional, Type, TypeVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 from collections import OrderedDict
 
 from basyx.aas import model
@@ -32,6 +37,21 @@ class KeyTest(unittest.TestCase):
         ident = 'test'
         self.assertEqual(key1.__eq__(ident), NotImplemented)
 
+    def test_immutable(self):
+        key1 = model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:submodel1")
+        with self.assertRaises(AttributeError):
+            key1.value = "urn:x-test:submodel2"  # type: ignore
+        with self.assertRaises(AttributeError):
+            key1.foo = "bar"  # type: ignore
+        self.assertFalse(hasattr(key1, "__dict__"))
+
+    def test_copy_and_pickle(self):
+        key1 = model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:submodel1")
+        for key2 in (copy.copy(key1), copy.deepcopy(key1), pickle.loads(pickle.dumps(key1))):
+            self.assertEqual(key1, key2)
+            self.assertEqual(hash(key1), hash(key2))
+            self.assertIs(model.KeyTypes.SUBMODEL, key2.type)
+
     def test_from_referable(self):
         mlp1 = model.MultiLanguageProperty(None)
         mlp2 = model.MultiLanguageProperty(None)
@@ -58,17 +78,15 @@ class ExampleRefereableWithNamespace(model.Referable, model.UniqueIdShortNamespa
 
 
 class MockBackend(backends.Backend):
-    @classmethod
-    def update_object(cls,
-                      updated_object: "Referable",  # type: ignore
+    @staticmethod
+    def update_object(updated_object: "Referable",  # type: ignore
                       store_object: "Referable",  # type: ignore
-                      relative_path: List[str]) -> None: ...
+                      relative_path: Tuple[str, ...]) -> None: ...
 
-    @classmethod
-    def commit_object(cls,
-                      committed_object: "Referable",  # type: ignore
+    @staticmethod
+    def commit_object(committed_object: "Referable",  # type: ignore
                       store_object: "Referable",  # type: ignore
-                      relative_path: List[str]) -> None: ...
+                      relative_path: Tuple[str, ...]) -> None: ...
 
     update_object = mock.Mock()
     commit_object = mock.Mock()
@@ -168,7 +186,7 @@ class ReferableTest(unittest.TestCase):
         MockBackend.update_object.assert_called_once_with(
             updated_object=example_referable,
             store_object=example_grandparent,
-            relative_path=["exampleGrandparent", "exampleParent", "exampleReferable"]
+            relative_path=("exampleGrandparent", "exampleParent", "exampleReferable")
         )
         MockBackend.update_object.reset_mock()
 
@@ -178,10 +196,10 @@ class ReferableTest(unittest.TestCase):
         MockBackend.update_object.assert_has_calls([
             mock.call(updated_object=example_referable,
                       store_object=example_grandparent,
-                      relative_path=["exampleGrandparent", "exampleParent", "exampleReferable"]),
+                      relative_path=("exampleGrandparent", "exampleParent", "exampleReferable")),
             mock.call(updated_object=example_grandchild,
                       store_object=example_grandchild,
-                      relative_path=[])
+                      relative_path=())
         ])
         MockBackend.update_object.reset_mock()
 
@@ -191,7 +209,7 @@ class ReferableTest(unittest.TestCase):
         MockBackend.update_object.assert_called_once_with(
             updated_object=example_referable,
             store_object=example_referable,
-            relative_path=[]
+            relative_path=()
         )
         MockBackend.update_object.reset_mock()
 
@@ -201,6 +219,27 @@ class ReferableTest(unittest.TestCase):
         example_referable.update(recursive=False)
         MockBackend.update_object.assert_not_called()
 
+    def test_update_max_age(self):
+        backends.register_backend("mockScheme", MockBackend)
+        example_referable = generate_example_referable_tree()
+        example_grandchild = example_referable.get_referable("exampleChild").get_referable("exampleGrandchild")
+        MockBackend.update_object.reset_mock()
+
+        # The first update is never skipped
+        example_referable.update(max_age=60)
+        self.assertEqual(MockBackend.update_object.call_count, 2)
+        MockBackend.update_object.reset_mock()
+
+        # Subsequent updates within max_age are skipped, also for children with their own source
+        example_referable.update(max_age=60)
+        example_grandchild.update(max_age=60)
+        MockBackend.update_object.assert_not_called()
+
+        # Without max_age, the objects are updated again
+        example_referable.update()
+        self.assertEqual(MockBackend.update_object.call_count, 2)
+        MockBackend.update_object.reset_mock()
+
     def test_commit(self):
         backends.register_backend("mockScheme", MockBackend)
         example_referable = generate_example_referable_tree()
@@ -213,10 +252,10 @@ class ReferableTest(unittest.TestCase):
         MockBackend.commit_object.assert_has_calls([
             mock.call(committed_object=example_referable,
                       store_object=example_grandparent,
-                      relative_path=["exampleParent", "exampleReferable"]),
+                      relative_path=("exampleParent", "exampleReferable")),
             mock.call(committed_object=example_grandchild,
                       store_object=example_grandchild,
-                      relative_path=[])
+                      relative_path=())
         ])
         MockBackend.commit_object.reset_mock()
 
@@ -226,10 +265,10 @@ class ReferableTest(unittest.TestCase):
         MockBackend.commit_object.assert_has_calls([
             mock.call(committed_object=example_grandchild,
                       store_object=example_grandparent,
-                      relative_path=["exampleParent", "exampleReferable", "exampleChild", "exampleGrandchild"]),
+                      relative_path=("exampleParent", "exampleReferable", "exampleChild", "exampleGrandchild")),
             mock.call(committed_object=example_grandchild,
                       store_object=example_grandchild,
-                      relative_path=[])
+                      relative_path=())
         ])
         MockBackend.commit_object.reset_mock()
 
@@ -240,14 +279,30 @@ class ReferableTest(unittest.TestCase):
         MockBackend.commit_object.assert_has_calls([
             mock.call(committed_object=example_grandchild,
                       store_object=example_referable,
-                      relative_path=["exampleChild", "exampleGrandchild"]),
+                      relative_path=("exampleChild", "exampleGrandchild")),
             mock.call(committed_object=example_grandchild,
                       store_object=example_grandparent,
-                      relative_path=["exampleParent", "exampleReferable", "exampleChild", "exampleGrandchild"]),
+                      relative_path=("exampleParent", "exampleReferable", "exampleChild", "exampleGrandchild")),
             mock.call(committed_object=example_grandchild,
                       store_object=example_grandchild,
-                      relative_path=[])
+                      relative_path=())
         ])
+        MockBackend.commit_object.reset_mock()
+
+        # The backends of all sources are resolved, before committing to any of them
+        example_grandparent.source = "unknownMockScheme:exampleGrandparent"
+        with self.assertRaises(backends.UnknownBackendException):
+            example_grandchild.commit()
+        MockBackend.commit_object.assert_not_called()
+        example_grandparent.source = "mockScheme:exampleGrandparent"
+        example_referable.source = ""
+        example_referable.get_referable("exampleChild").source = "mockScheme:exampleChild"
+        example_grandchild.source = "unknownMockScheme:exampleGrandchild"
+        with self.assertRaises(backends.UnknownBackendException):
+            example_referable.commit()
+        MockBackend.commit_object.assert_called_once_with(committed_object=example_referable,
+                                                          store_object=example_grandparent,
+                                                          relative_path=("exampleParent", "exampleReferable"))
 
     def test_update_from(self):
         example_submodel = example_aas.create_example_submodel()
@@ -281,6 +336,17 @@ class ReferableTest(unittest.TestCase):
         # Sources of embedded objects should always be updated
         self.assertEqual("scheme:NewRelElSource", example_relel.source)
 
+        # The timestamps of the last backend update must not be copied, neither for the object itself nor for embedded
+        # objects
+        example_submodel._last_source_update = 1.0
+        example_relel._last_source_update = 2.0
+        other_submodel._last_source_update = 3.0
+        other_relel._last_source_update = 4.0
+        for update_source in (False, True):
+            example_submodel.update_from(other_submodel, update_source=update_source)
+            self.assertEqual(1.0, example_submodel._last_source_update)
+            self.assertEqual(2.0, example_relel._last_source_update)
+
     def test_update_commit_qualifier_extension_semantic_id(self):
         submodel = model.Submodel("https://acplt.org/Test_Submodel")
         submodel.update()
@@ -428,6 +494,10 @@ class ModelNamespaceTest(unittest.TestCase):
         self.assertIsNone(self.prop1.parent)
         self.namespace.set1.add(self.prop1)
         self.assertEqual(2, len(self.namespace.set1))
+        with self.assertRaises(KeyError):
+            self.namespace.set1.remove(self.prop1alt)
+        self.assertIs(self.prop1, self.namespace.set1.get("id_short", "Prop1"))
+        self.assertIs(self.namespace, self.prop1.parent)
         self.namespace.set1.remove_by_id("id_short", self.prop1.id_short)
         self.assertEqual(1, len(self.namespace.set1))
         self.assertIsNone(self.prop1.parent)
@@ -449,6 +519,11 @@ class ModelNamespaceTest(unittest.TestCase):
         self.assertIsNone(self.prop1.parent)
         self.namespace.set1.discard(self.prop1)
 
+        # set1 has two unique attributes, pop() must remove the object from both backends
+        popped = self.namespace.set1.pop()
+        self.assertEqual(0, len(self.namespace.set1))
+        self.assertFalse(self.namespace.set1.contains_id("semantic_id", popped.semantic_id))
+
         self.namespace3.set1.add(self.qualifier1)
         self.assertEqual(1, len(self.namespace3.set1))
         self.namespace3.set1.add(self.qualifier2)
@@ -459,6 +534,30 @@ class ModelNamespaceTest(unittest.TestCase):
                          "of objects (Constraint AASd-021)",
                          str(cm.exception))
 
+    def test_NamespaceSet_init(self) -> None:
+        namespace = self._namespace_class([self.prop1, self.prop6])
+        self.assertEqual(2, len(namespace.set2))
+        self.assertIs(self.prop6, namespace.set2.get("id_short", "PROP4"))
+        self.assertIs(namespace, self.prop1.parent)
+        self.assertIs(namespace, self.prop6.parent)
+
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            self._namespace_class([self.prop3, self.prop8])
+        self.assertEqual("Object with attribute (name='id_short', value='ProP2') is already present in this set "
+                         "of objects (Constraint AASd-022)",
+                         str(cm.exception))
+        self.assertIsNone(self.prop3.parent)
+        self.assertIsNone(self.prop8.parent)
+
+        self.namespace.set1.add(self.prop5)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            model.NamespaceSet(self.namespace, [("id_short", False)], [self.prop2, self.prop4])
+        self.assertEqual("Object with attribute (name='id_short', value='Prop3') is already present in another "
+                         "set in the same namespace (Constraint AASd-022)",
+                         str(cm.exception))
+        self.assertIsNone(self.prop2.parent)
+        self.assertIsNone(self.prop4.parent)
+
     def test_namespaceset_hooks(self) -> None:
         T = TypeVar("T", bound=model.Referable)
         nss_types: List[Type[model.NamespaceSet]] = [model.NamespaceSet, model.OrderedNamespaceSet]
@@ -560,6 +659,19 @@ class ModelNamespaceTest(unittest.TestCase):
             self.assertEqual(prop.id_short, "test_prop")
             self.assertIsNone(prop.parent)
 
+            # discard() only ignores objects, which are not contained, but not exceptions of the item_id_del_hook
+            def id_del_hook_failing(_old: T) -> None:
+                raise KeyError("failing hook")
+
+            cap2 = model.Capability("test_cap2")
+            dummy_ns = DummyNamespace({cap2}, item_id_del_hook=id_del_hook_failing)
+            dummy_ns.set1.discard(prop)
+            with self.assertRaises(KeyError) as cm:
+                dummy_ns.set1.discard(cap2)
+            self.assertEqual("'failing hook'", str(cm.exception))
+            self.assertEqual(0, len(dummy_ns.set1))
+            self.assertEqual([], list(dummy_ns.set1))
+
     def test_Namespace(self) -> None:
         with self.assertRaises(model.AASConstraintViolation) as cm:
             namespace_test = ExampleNamespaceReferable([self.prop1, self.prop2, self.prop1alt])
@@ -610,6 +722,9 @@ class ModelNamespaceTest(unittest.TestCase):
         self.assertIn("already present", str(cm.exception))
         self.extension1.name = "Ext3"
         self.assertEqual(self.extension1.name, "Ext3")
+        # Assigning the current value again is a no-op and does not collide with the object itself
+        self.extension1.name = "Ext3"
+        self.assertIs(self.extension1, self.namespace.set3.get("name", "Ext3"))
 
         self.namespace.set4.add(self.qualifier1)
         self.namespace.set4.add(self.qualifier2)
@@ -618,6 +733,22 @@ class ModelNamespaceTest(unittest.TestCase):
         self.assertIn("already present", str(cm.exception))
         self.qualifier1.type = "type3"
         self.assertEqual(self.qualifier1.type, "type3")
+        self.qualifier1.type = "type3"
+        self.assertEqual(self.qualifier1.type, "type3")
+
+    def test_renaming_semantic_id(self) -> None:
+        self.namespace.set1.add(self.prop1)
+        self.namespace.set1.add(self.prop3)
+        with self.assertRaises(KeyError) as cm:
+            self.prop1.semantic_id = self.propSemanticID2
+        self.assertIn("already present", str(cm.exception))
+        self.assertIs(self.prop1, self.namespace.set1.get_object_by_attribute("semantic_id", self.propSemanticID))
+
+        self.prop1.semantic_id = self.propSemanticID3
+        self.assertIs(self.prop1, self.namespace.set1.get_object_by_attribute("semantic_id", self.propSemanticID3))
+        self.prop1.semantic_id = self.propSemanticID3
+        self.assertFalse(self.namespace.set1.contains_id("semantic_id", self.propSemanticID))
+        self.assertIs(self.prop1, self.namespace.get_referable("Prop1"))
 
     def test_Namespaceset_update_from(self) -> None:
         # Prop1 is getting its value updated by namespace2.set1
@@ -647,6 +778,14 @@ class ModelNamespaceTest(unittest.TestCase):
             namespace1.get_referable("Prop2")
         self.assertIsNone(prop2.parent)
 
+        # Prop4 is missing in namespace4.set1 with respect to both unique attributes, but must only be removed once
+        prop4 = model.Property("Prop4", model.datatypes.Int, 0, semantic_id=self.propSemanticID3)
+        namespace1.set1.add(prop4)
+        namespace4 = self._namespace_class()
+        namespace1.set1.update_nss_from(namespace4.set1)
+        self.assertEqual(0, len(namespace1.set1))
+        self.assertIsNone(prop4.parent)
+
     def test_qualifiable_id_short_namespace(self) -> None:
         prop1 = model.Property("Prop1", model.datatypes.Int, 1)
         qualifier1 = model.Qualifier("Qualifier1", model.datatypes.Int, 2)
@@ -727,6 +866,83 @@ class ModelOrderedNamespaceTest(ModelNamespaceTest):
         self.assertEqual("'Referable with id_short Prop1 not found in this namespace'",
                          str(cm2.exception))
 
+    def test_OrderedNamespace_modification(self) -> None:
+        self.namespace.set2.extend([self.prop1, self.prop2, self.prop5])
+        self.assertEqual(self.prop2, self.namespace.set2[1])
+        self.namespace.set2.remove(self.prop2)
+        self.assertEqual((self.prop1, self.prop5), tuple(self.namespace.set2))
+        self.assertEqual(self.prop5, self.namespace.set2[1])
+        self.namespace.set2.append(self.prop2)
+        self.assertEqual([self.prop5, self.prop2], self.namespace.set2[1:])
+        self.assertIs(self.prop1, self.namespace.set2.pop(0))
+        self.assertIsNone(self.prop1.parent)
+        self.assertEqual((self.prop5, self.prop2), tuple(self.namespace.set2))
+
+        self.namespace.set2[0:1] = [self.prop6]
+        self.assertEqual((self.prop6, self.prop2), tuple(self.namespace.set2))
+        self.assertEqual(2, len(self.namespace.set2))
+        self.assertIsNone(self.prop5.parent)
+        self.assertEqual(1, self.namespace.set2.index(self.prop2))
+
+        # Replacing an object with another one having the same id_short
+        self.namespace.set2[1] = self.prop3
+        self.assertEqual((self.prop6, self.prop3), tuple(self.namespace.set2))
+        self.assertIsNone(self.prop2.parent)
+        self.namespace.set2[:] = (self.prop7, self.prop1)
+        self.assertEqual((self.prop7, self.prop1), tuple(self.namespace.set2))
+        self.assertIsNone(self.prop6.parent)
+        self.assertIsNone(self.prop3.parent)
+
+        # A failing replacement is rolled back
+        with self.assertRaises(model.AASConstraintViolation):
+            self.namespace.set2[0:2] = (self.prop2, self.prop8)
+        self.assertEqual((self.prop7, self.prop1), tuple(self.namespace.set2))
+        self.assertIs(self.prop7, self.namespace.set2.get("id_short", "Prop2"))
+        self.assertIs(self.namespace, self.prop7.parent)
+        self.assertIsNone(self.prop2.parent)
+        self.assertIsNone(self.prop8.parent)
+
+        # An extended slice must be replaced by the same number of items, the set must be left unchanged otherwise
+        self.namespace.set2.extend((self.prop5, self.prop6))
+        with self.assertRaises(ValueError):
+            self.namespace.set2[::2] = [self.prop3]
+        self.assertEqual((self.prop7, self.prop1, self.prop5, self.prop6), tuple(self.namespace.set2))
+        self.assertEqual(4, len(self.namespace.set2))
+        self.assertIs(self.prop7, self.namespace.set2.get("id_short", "Prop2"))
+        self.assertIsNone(self.prop3.parent)
+        self.namespace.set2[::2] = [self.prop3, self.prop4]
+        self.assertEqual((self.prop3, self.prop1, self.prop4, self.prop6), tuple(self.namespace.set2))
+        self.assertIsNone(self.prop7.parent)
+        self.assertIsNone(self.prop5.parent)
+        self.namespace.set2[::2] = [self.prop7, self.prop5]
+
+        del self.namespace.set2[-1]
+        self.assertEqual((self.prop7, self.prop1, self.prop5), tuple(self.namespace.set2))
+        self.assertEqual(self.prop5, self.namespace.set2[-1])
+        self.assertIsNone(self.prop6.parent)
+        del self.namespace.set2[:2]
+        self.assertEqual((self.prop5,), tuple(self.namespace.set2))
+        self.assertFalse(self.namespace.set2.contains_id("id_short", "Prop1"))
+
+        # Positional modifications followed by removals and appends keep the order consistent
+        self.namespace.set2.append(self.prop1)
+        self.namespace.set2[0] = self.prop6
+        self.namespace.set2[1] = self.prop3
+        self.assertEqual((self.prop6, self.prop3), tuple(self.namespace.set2))
+        self.namespace.set2.remove(self.prop6)
+        self.namespace.set2.append(self.prop1)
+        self.assertEqual((self.prop3, self.prop1), tuple(self.namespace.set2))
+        self.assertEqual([self.prop3, self.prop1], self.namespace.set2[:])
+
+    def test_renaming_keeps_order(self) -> None:
+        self.namespace.set2.add(self.prop1)
+        self.namespace.set2.add(self.prop2)
+        self.prop1.id_short = "Prop3"
+        self.assertEqual((self.prop1, self.prop2), tuple(self.namespace.set2))
+        # set2 is case-insensitive
+        self.assertIs(self.prop1, self.namespace.set2.get("id_short", "PROP3"))
+        self.assertFalse(self.namespace.set2.contains_id("id_short", "PROP1"))
+
 
 class ExternalReferenceTest(unittest.TestCase):
     def test_constraints(self):
@@ -836,6 +1052,27 @@ class ModelReferenceTest(unittest.TestCase):
             ref.referred_semantic_id = model.ExternalReference(
                 (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
         self.assertEqual('Reference is immutable', str(cm.exception))
+        # References use slots, so there is no instance dict to bypass the immutability
+        self.assertFalse(hasattr(ref, "__dict__"))
+
+    def test_copy_and_pickle(self):
+        semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:sem"),))
+        ext_ref = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),),
+                                          referred_semantic_id=semantic_id)
+        model_ref = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),), model.Submodel,
+                                         referred_semantic_id=semantic_id)
+        for ref in (ext_ref, model_ref):
+            for ref_copy in (copy.copy(ref), copy.deepcopy(ref), pickle.loads(pickle.dumps(ref))):
+                self.assertIs(ref.__class__, ref_copy.__class__)
+                self.assertEqual(ref, ref_copy)
+                self.assertEqual(hash(ref), hash(ref_copy))
+                self.assertEqual(semantic_id, ref_copy.referred_semantic_id)
+        self.assertIs(model.Submodel, copy.deepcopy(model_ref).type)
+
+        submodel = model.Submodel("urn:x-test:submodel", semantic_id=semantic_id)
+        submodel_copy = copy.deepcopy(submodel)
+        self.assertEqual(semantic_id, submodel_copy.semantic_id)
+        self.assertIsNot(submodel.semantic_id, submodel_copy.semantic_id)
 
     def test_equality(self):
         ref = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),),
@@ -1050,6 +1287,37 @@ class ValueReferencePairTest(unittest.TestCase):
         self.assertEqual(pair.value, "3")
 
 
+class SpecificAssetIdTest(unittest.TestCase):
+    def test_equality_and_hash(self):
+        subject_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, 'test'),))
+        id1 = model.SpecificAssetId("name", "value", subject_id)
+        id2 = model.SpecificAssetId("name", "value", model.ExternalReference(
+            (model.Key(model.KeyTypes.GLOBAL_REFERENCE, 'test'),)))
+        id3 = model.SpecificAssetId("name", "other_value", subject_id)
+        self.assertEqual(id1, id2)
+        self.assertEqual(hash(id1), hash(id2))
+        self.assertNotEqual(id1, id3)
+        self.assertEqual({id1, id3}, {id2, id3})
+        with self.assertRaises(AttributeError):
+            id1._hash = 0  # type: ignore
+
+    def test_pickle_across_processes(self):
+        # Pickle in a process with a different hash seed, the cached hash must not be restored as it is
+        code = ("import pickle, sys\n"
+                "from basyx.aas import model\n"
+                "subject_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, 'test'),))\n"
+                "sys.stdout.buffer.write(pickle.dumps(model.SpecificAssetId('name', 'value', subject_id)))\n")
+        env = dict(os.environ, PYTHONHASHSEED="1" if os.environ.get("PYTHONHASHSEED") != "1" else "2")
+        pickled = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, check=True).stdout
+        restored = pickle.loads(pickled)
+        subject_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, 'test'),))
+        fresh = model.SpecificAssetId("name", "value", subject_id)
+        self.assertEqual(fresh, restored)
+        self.assertEqual(hash(fresh), hash(restored))
+        self.assertIn(restored, {fresh})
+        self.assertEqual(fresh, copy.deepcopy(fresh))
+
+
 class HasSemanticsTest(unittest.TestCase):
     def test_supplemental_semantic_id_constraint(self) -> None:
         extension = model.Extension(name='test')
@@ -76,6 +76,8 @@ class StringConstraintsDecoratorTest(unittest.TestCase):
             dc.some_attr = "a" * 2001
         self.assertEqual("PathType has a maximum length of 2000! (length: 2001)", cm.exception.args[0])
         self.assertEqual(dc.some_attr, "a")
+        # The property must not expose the docstring of its getter implementation in the API docs
+        self.assertFalse(self.DummyClass.some_attr.__doc__)  # type: ignore
 
     def test_ignore_none_values(self) -> None:
         # None values should be ignored as some decorated attributes are optional. As shown in the following,
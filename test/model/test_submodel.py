@@ -245,6 +245,40 @@ class SubmodelElementListTest(unittest.TestCase):
         self.assertEqual("id_short of MultiLanguageProperty[test_list[0]] cannot be set, because it is "
                          "contained in a SubmodelElementList[test_list] (Constraint AASd-120)", str(cm.exception))
 
+    def test_semantic_id_change(self):
+        semantic_id1 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:test"),))
+        semantic_id2 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:different"),))
+
+        # AASd-107
+        mlp1 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        mlp2 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        list_ = model.SubmodelElementList("test_list", model.MultiLanguageProperty, [mlp1, mlp2],
+                                          semantic_id_list_element=semantic_id1)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            mlp1.semantic_id = semantic_id2
+        self.assertEqual(107, cm.exception.constraint_id)
+        self.assertIs(semantic_id1, mlp1.semantic_id)
+        self.assertIs(list_, mlp1.parent)
+        self.assertEqual([mlp1, mlp2], list(list_.value))
+
+        # AASd-114
+        mlp1 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        mlp2 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        mlp3 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        list_ = model.SubmodelElementList("test_list", model.MultiLanguageProperty, [mlp1, mlp2, mlp3])
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            mlp2.semantic_id = semantic_id2
+        self.assertEqual(114, cm.exception.constraint_id)
+        self.assertIs(semantic_id1, mlp2.semantic_id)
+        self.assertIs(list_, mlp2.parent)
+        self.assertEqual([mlp1, mlp2, mlp3], list(list_.value))
+        self.assertIs(mlp2, list_.value[1])
+
+        # Valid changes keep the position of the element
+        mlp2.semantic_id = None
+        mlp2.semantic_id = semantic_id1
+        self.assertEqual([mlp1, mlp2, mlp3], list(list_.value))
+
     def test_aasd_108_add_set(self):
         prop = model.Property(None, model.datatypes.Int)
         mlp1 = model.MultiLanguageProperty(None)